@@ -1,6 +1,7 @@
-import os
 import uuid
-import json
+from pathlib import Path
+import aiofiles
+import orjson
 from fastapi import (
     APIRouter,
     UploadFile,
@@ -14,7 +15,9 @@ from typing import Optional
 from sse_starlette.sse import EventSourceResponse
 from stt_api.services.storage import job_manager, JobType, JobStatus
 from stt_api.services import tasks
+from stt_api.services.pipeline import batch_job_queue
 from stt_api.core.config import settings
+from stt_api.core.background_tasks import fire_and_forget
 from stt_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +26,23 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+# 업로드 파일을 디스크로 옮길 때 사용하는 청크 크기 (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _discard_temp_file(path: Path) -> None:
+    """임시 파일 삭제 (이미 없으면 무시)"""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.error("임시 파일 삭제 실패", file_path=str(path), error=str(e))
+
+
+def _sse_data(payload: dict) -> str:
+    """SSE data 필드 직렬화 (stdlib json 대신 C 구현 orjson 사용)"""
+    return orjson.dumps(payload).decode()
+
+
 @router.post("/api/v1/conversation/request", status_code=202)
 async def create_conversation_request(
         file: UploadFile = File(...),
@@ -44,10 +64,14 @@ async def create_conversation_request(
     # 1. 파일 저장
     try:
         file_ext = file.filename.split(".")[-1]
-        temp_file_path = os.path.join(settings.TEMP_AUDIO_DIR, f"{job_id}.{file_ext}")
-        contents = await file.read()
-        with open(temp_file_path, "wb") as f:
-            f.write(contents)
+        temp_path = Path(settings.TEMP_AUDIO_DIR) / f"{job_id}.{file_ext}"
+        temp_file_path = str(temp_path)
+        # ✅ 전체 파일을 메모리에 올리지 않고 고정 크기 청크로 디스크에 기록
+        file_size = 0
+        async with aiofiles.open(temp_file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                await f.write(chunk)
     except Exception as e:
         logger.error("파일 저장 실패", error_messag=e)
         raise HTTPException(
@@ -58,7 +82,7 @@ async def create_conversation_request(
     # 2. DB에 BATCH 작업 생성 (우선순위 1)
     metadata = {
         "filename": file.filename,
-        "file_size": len(contents),
+        "file_size": file_size,
         "file_path": temp_file_path,
         # 👇 여기에 도메인 종속 데이터를 넣습니다.
         "cure_seq": cure_seq,
@@ -74,26 +98,27 @@ async def create_conversation_request(
         )
 
         if not success:
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+            _discard_temp_file(temp_path)
             raise HTTPException(status_code=500, detail="작업 생성 실패")
 
     except Exception as e:
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+        _discard_temp_file(temp_path)
         raise HTTPException(status_code=500, detail=f"작업 생성 실패: {str(e)}")
 
-    # 3. Celery Task 백그라운드 작업 예약
+    # 3. 백그라운드 작업 예약 (Celery 또는 인프로세스 큐)
     try:
-        tasks.run_stt_and_summary_pipeline.delay(job_id, temp_file_path)
-        logger.info("작업 생성 완료", job_id=job_id)
+        if settings.BATCH_EXECUTOR == "inprocess":
+            await batch_job_queue.submit(job_id, temp_file_path)
+        else:
+            tasks.run_stt_and_summary_pipeline.delay(job_id, temp_file_path)
+        logger.info("작업 생성 완료", job_id=job_id, executor=settings.BATCH_EXECUTOR)
     except Exception as e:
         error_msg = f"Celery 작업 예약 실패: {str(e)}"
         logger.error("Celery 작업 예약 실패", error_msg=e)
 
-        # ✅ JobManager로 실패 상태 업데이트 (await 추가)
-        await job_manager.update_status(job_id, JobStatus.COMPLETED, error_message=error_msg)
-        await job_manager.log_error(job_id, "celery_task", error_msg)
+        # ✅ 실패 상태/에러 로그 기록은 응답을 막지 않도록 백그라운드로 실행
+        fire_and_forget(job_manager.update_status(job_id, JobStatus.COMPLETED, error_message=error_msg))
+        fire_and_forget(job_manager.log_error(job_id, "celery_task", error_msg))
 
         raise HTTPException(status_code=500, detail=error_msg)
 
@@ -130,9 +155,22 @@ async def stream_events(job_id: str, request: Request):
 
     # ✅ 현재 작업 상태 미리 확보
     current_job_status = job.get("status", "PENDING")
+    is_completed = current_job_status.upper() == "COMPLETED"
 
     async def event_generator():
+        # ✅ 과거 세그먼트 조회 전에 구독을 걸고 서버의 구독 확인까지 기다림
+        # (확인 이후 발행된 이벤트는 실시간으로 받으므로 과거 데이터 재생 중 발행분도 유실하지 않음)
+        subscription = None
+
         try:
+            if not is_completed:
+                subscription = job_manager.subscribe_events(job_id)
+                try:
+                    await subscription.__anext__()  # 구독 확인 신호
+                except StopAsyncIteration:
+                    logger.warning("[SSE] 이벤트 구독 실패, 과거 데이터만 전송", job_id=job_id)
+                    subscription = None
+
             # ✅ STEP 1: 과거 세그먼트 전송 (DB에서 조회) - await 추가
             past_segments = await job_manager.get_segments(job_id)
 
@@ -142,31 +180,30 @@ async def stream_events(job_id: str, request: Request):
                 count=len(past_segments)
             )
 
-            for segment in past_segments:
+            # segment_number는 저장 순서상 위치 (실시간 이벤트의 번호와 같은 키 → 클라이언트에서 중복 제거 가능)
+            for segment_number, segment in enumerate(past_segments, start=1):
                 if await request.is_disconnected():
                     logger.info("[SSE] 클라이언트 연결 끊김 (과거 데이터 전송 중)")
                     return
 
                 yield {
                     "event": "transcript_segment",
-                    "data": json.dumps({
+                    "data": _sse_data({
                         "type": "transcript_segment",
                         "text": segment["segment_text"],
-                        "segment_number": segment.get("segment_number", 0),
+                        "segment_number": segment_number,
                         "is_historical": True,  # ✅ 과거 데이터 표시
                         "status": current_job_status
                     })
                 }
 
             # ✅ STEP 2: 현재 상태 확인 (이미 완료된 경우 final_summary 전송)
-            current_status = job.get("status", "").upper()
-
-            if current_status == "COMPLETED":
+            if is_completed:
                 logger.info("[SSE] 작업이 이미 완료됨, final_summary 전송")
 
                 yield {
                     "event": "final_summary",
-                    "data": json.dumps({
+                    "data": _sse_data({
                         "type": "final_summary",
                         "summary": job.get("structured_summary", {}),
                         "segment_count": len(past_segments),
@@ -176,16 +213,19 @@ async def stream_events(job_id: str, request: Request):
                 }
                 return  # 스트림 종료
 
-            # ✅ STEP 3: 실시간 이벤트 구독 (진행 중인 경우)
+            # ✅ STEP 3: 실시간 이벤트 수신 (진행 중인 경우, 구독은 이미 연결됨)
+            if subscription is None:
+                return
+
             logger.info("[SSE] 실시간 이벤트 구독 시작", job_id=job_id)
 
-            async for message_data in job_manager.subscribe_events(job_id):
+            async for message_data in subscription:
                 if await request.is_disconnected():
                     logger.info("[SSE] 클라이언트 연결 끊김 (실시간 구독 중)")
                     break
 
                 event_type = message_data.get("type", "message")
-                data_json = json.dumps(message_data)
+                data_json = _sse_data(message_data)
 
                 yield {
                     "event": event_type,
@@ -206,14 +246,19 @@ async def stream_events(job_id: str, request: Request):
             error_msg = f"스트리밍 중 오류: {str(e)}"
             logger.error("스트리밍 중 오류", error_msg=e)
 
-            # ✅ JobManager로 에러 로깅 (await 추가)
-            await job_manager.log_error(job_id, "sse_stream", error_msg)
+            # ✅ 에러 로깅은 기다리지 않고 바로 error 이벤트 전송
+            fire_and_forget(job_manager.log_error(job_id, "sse_stream", error_msg))
 
             yield {
                 "event": "error",
-                "data": json.dumps({"message": error_msg})
+                "data": _sse_data({"message": error_msg})
             }
 
+        finally:
+            # ✅ 미리 걸어 둔 구독 정리
+            if subscription is not None:
+                await subscription.aclose()
+
     return EventSourceResponse(event_generator())
 
 
@@ -16,18 +16,34 @@ from fastapi import (
     HTTPException,
     Query
 )
-from typing import Optional
-import wave
+from typing import Final, Optional
+import asyncio
+import logging
 import os
+import shutil
+import struct
+
+import numpy as np
 
 from stt_api.core.config import settings
 from stt_api.domain.streaming_job import StreamingJob
 from stt_api.services.pipeline import StreamPipeline
 from stt_api.services.storage import job_manager, JobType, JobStatus
-from stt_api.services.audio_converter import AudioStreamConverter
+from stt_api.services.audio_converter import AudioStreamConverter, get_converter_config
 from stt_api.core.config import active_jobs, constants
+from stt_api.core.background_tasks import fire_and_forget
 from stt_api.core.logging_config import get_logger
 from stt_api.core.exceptions import CustomException
+from stt_api.api.ws_protocol import (
+    build_templates,
+    close_with_error,
+    render_template,
+    send_encoded,
+    send_messages,
+    ENCODING_BINARY,
+    JOB_ID_PLACEHOLDER,
+    SUPPORTED_ENCODINGS
+)
 from stt_api.services.storage import db_service
 from pydantic import BaseModel, Field
 
@@ -35,6 +51,72 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# VAD 프레임 1개의 바이트 수 (16-bit mono) — 정수 연산으로 한 번만 계산
+VAD_FRAME_BYTES: Final[int] = (constants.VAD_SAMPLE_RATE * constants.VAD_FRAME_DURATION_MS * 2) // 1000
+
+# 청크 단위 실시간 변환이 가능한 입력 포맷
+_STREAMING_FORMATS: Final[frozenset] = frozenset({"opus", "pcm", "webm", "raw"})
+
+# connection_success 메시지는 job_id / encoding 외에는 고정이므로 인코딩별로 한 번만 직렬화
+_CONN_SUCCESS_TEMPLATES: Final[dict] = build_templates({
+    "type": "connection_success",
+    "message": f"Job {JOB_ID_PLACEHOLDER}에 성공적으로 연결되었습니다.",
+    "vad_config": {
+        "sample_rate": constants.VAD_SAMPLE_RATE,
+        "frame_duration_ms": constants.VAD_FRAME_DURATION_MS
+    }
+})
+
+
+def _wav_header(data_bytes: int, sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    """PCM 데이터 길이로 44바이트 WAV(RIFF) 헤더 생성"""
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample,
+        b"data", data_bytes
+    )
+
+
+def _finalize_debug_wav(raw_path: str, wav_path: str) -> None:
+    """[디버깅용] 수신 중 덤프한 원본 PCM 앞에 WAV 헤더를 붙여 WAV 파일로 변환"""
+    data_bytes = os.path.getsize(raw_path)
+
+    with open(wav_path, "wb") as wav_file, open(raw_path, "rb") as raw_file:
+        # 16k, 1ch, 16bit PCM 포맷
+        wav_file.write(_wav_header(data_bytes, 16000, 1, 16))
+        shutil.copyfileobj(raw_file, wav_file)
+
+    os.remove(raw_path)
+
+
+async def _receive_loop(websocket: WebSocket, audio_queue: asyncio.Queue):
+    """
+    WebSocket 수신 전용 태스크 (producer)
+
+    STT 처리 중에도 소켓을 계속 비워 커널 수신 버퍼가 쌓이지 않도록 함.
+    연결이 끊기면 None(종료 신호)을, 그 외 오류는 예외 객체를 큐에 넣어 소비자에게 전달.
+
+    빈 프레임(keepalive)은 버리고, STREAM_MAX_CHUNK_BYTES를 넘는 프레임이 오면
+    1009(Message Too Big)로 연결을 닫은 뒤 그때까지 받은 오디오로 마무리합니다.
+    """
+    try:
+        # iter_bytes()는 연결 종료 시 WebSocketDisconnect 없이 반복을 끝냄
+        async for chunk in websocket.iter_bytes():
+            if not chunk:
+                continue
+            if len(chunk) > constants.STREAM_MAX_CHUNK_BYTES:
+                logger.warning("오디오 프레임 크기 초과", chunk_bytes=len(chunk))
+                await close_with_error(websocket, "Audio frame too large", code=1009)
+                break
+            await audio_queue.put(chunk)
+    except Exception as e:
+        await audio_queue.put(e)
+        return
+
+    await audio_queue.put(None)
+
 
 # ✅ 1. 요청 바디를 정의하는 Pydantic 모델 생성
 class StreamCreateRequest(BaseModel):
@@ -106,47 +188,8 @@ async def create_stream_job(
                 detail=f"방 생성/조회 실패: {str(e)}"
             )
 
-        # ✅ 2-2. 중복 참가자 체크
-        existing_job = await job_manager.check_member_exists(room_id, member_id)
-
-        if existing_job:
-            # 기존 작업 상태 확인
-            existing_status = existing_job.get("status", "").upper()
-
-            # PROCESSING 또는 PENDING 상태면 중복 접속으로 간주
-            if existing_status in ["PENDING", "PROCESSING"]:
-                logger.warning(
-                    "중복 참가자 접속 시도",
-                    room_id=room_id,
-                    member_id=member_id,
-                    existing_job_id=existing_job.get("job_id"),
-                    existing_status=existing_status
-                )
-
-                raise HTTPException(
-                    status_code=409,  # Conflict
-                    detail={
-                        "error": "DUPLICATE_MEMBER",
-                        "message": f"이미 '{member_id}'가 방 '{room_id}'에 참가 중입니다",
-                        "existing_job_id": existing_job.get("job_id"),
-                        "existing_status": existing_status,
-                        "suggestion": "기존 연결을 종료하거나 다른 member_id를 사용하세요"
-                    }
-                )
-
-            # COMPLETED/FAILED 상태면 재접속 허용
-            else:
-                logger.info(
-                    "참가자 재접속 (이전 작업 완료됨)",
-                    room_id=room_id,
-                    member_id=member_id,
-                    previous_job_id=existing_job.get("job_id"),
-                    previous_status=existing_status
-                )
-
     # ✅ 스트리밍 가능한 포맷 확인
-    streaming_formats = ["opus", "pcm", "webm", "raw"]
-    is_streaming = audio_format.lower() in streaming_formats
+    is_streaming = audio_format.lower() in _STREAMING_FORMATS
 
     # StreamingJob 생성
     metadata = {
@@ -162,8 +205,48 @@ async def create_stream_job(
         "mode": request.mode,
     }
 
-    job = StreamingJob(metadata=metadata)
-    active_jobs[job.job_id] = job
+    job = StreamingJob(
+        metadata=metadata,
+        room_id=room_id if is_conference_mode else None,
+        member_id=member_id if is_conference_mode else None
+    )
+
+    # ✅ 중복 참가자 체크: 참가자 슬롯 선점 (Redis SET NX 단일 왕복, 생성과 원자적)
+    if is_conference_mode:
+        existing_job = await job_manager.claim_member(room_id, member_id, job.job_id)
+
+        if existing_job:
+            existing_status = existing_job.get("status", "")
+
+            logger.warning(
+                "중복 참가자 접속 시도",
+                room_id=room_id,
+                member_id=member_id,
+                existing_job_id=existing_job.get("job_id"),
+                existing_status=existing_status
+            )
+
+            raise HTTPException(
+                status_code=409,  # Conflict
+                detail={
+                    "error": "DUPLICATE_MEMBER",
+                    "message": f"이미 '{member_id}'가 방 '{room_id}'에 참가 중입니다",
+                    "existing_job_id": existing_job.get("job_id"),
+                    "existing_status": existing_status,
+                    "suggestion": "기존 연결을 종료하거나 다른 member_id를 사용하세요"
+                }
+            )
+
+    # ✅ 연결되지 않고 방치된 작업 정리 (참가자 슬롯도 함께 해제)
+    for stale_job in active_jobs.add(job.job_id, job):
+        logger.warning("연결되지 않은 스트림 작업 만료", job_id=stale_job.job_id)
+        fire_and_forget(job_manager.update_status(
+            stale_job.job_id, JobStatus.COMPLETED, error_message="WebSocket 연결 없이 만료됨"
+        ))
+        if stale_job.room_id and stale_job.member_id:
+            fire_and_forget(job_manager.release_member(
+                stale_job.room_id, stale_job.member_id, stale_job.job_id
+            ))
 
     # ==================== 5. DB에 작업 생성 ====================
     try:
@@ -185,14 +268,17 @@ async def create_stream_job(
             )
 
         if not success:
-            del active_jobs[job.job_id]
+            active_jobs.pop(job.job_id, None)
+            if is_conference_mode:
+                await job_manager.release_member(room_id, member_id, job.job_id)
             raise HTTPException(status_code=500, detail="작업 생성 실패")
 
     except HTTPException:
         raise
     except Exception as e:
-        if job.job_id in active_jobs:
-            del active_jobs[job.job_id]
+        active_jobs.pop(job.job_id, None)
+        if is_conference_mode:
+            await job_manager.release_member(room_id, member_id, job.job_id)
         logger.error("작업 생성 중 오류", exc_info=True, error=str(e))
         raise HTTPException(
             status_code=500,
@@ -245,7 +331,8 @@ async def create_stream_job(
 @router.websocket("/ws/v1/stream/{job_id}")
 async def conversation_stream(
     websocket: WebSocket,
-    job_id: str
+    job_id: str,
+    encoding: str = Query(ENCODING_BINARY, description="결과 인코딩 (orjson-bytes 또는 json)")
 ):
     """
     WebRTC 원본 스트림을 받아 VAD 처리 후 STT 수행
@@ -255,31 +342,43 @@ async def conversation_stream(
     2. AudioStreamConverter로 16kHz/16-bit/Mono/30ms 변환
     3. VADProcessor로 음성 구간 감지
     4. STT 처리 및 실시간 결과 반환
+
+    결과는 기본적으로 바이너리 프레임(orjson bytes)으로 전송되며,
+    ?encoding=json 으로 연결하면 텍스트 프레임으로 전송됩니다.
     """
 
+    # ✅ 연결 단위 로그 컨텍스트 (이후 모든 로그에 job_id 포함)
+    log = logger.bind(job_id=job_id)
+
+    if encoding not in SUPPORTED_ENCODINGS:
+        log.error("지원하지 않는 인코딩으로 연결 시도", encoding=encoding)
+        await websocket.close(code=1008, reason="Unsupported encoding")
+        return
+
     # 1. Job 조회
     job = active_jobs.get(job_id)
 
     if not job:
-        logger.error("존재하지 않는 Job ID로 연결 시도", job_id=job_id)
+        log.error("존재하지 않는 Job ID로 연결 시도")
         await websocket.close(code=1008, reason="Job ID not found")
-        await job_manager.log_error(job_id, "websocket_stream", "존재하지 않는 Job ID")
+        fire_and_forget(job_manager.log_error(job_id, "websocket_stream", "존재하지 않는 Job ID"))
         return
 
+    # 연결 중에는 만료/축출 대상에서 제외 (종료 시 finally에서 pop)
+    active_jobs.pin(job_id)
+
     # 2. WebSocket 연결 수락
     await websocket.accept()
-    logger.info("클라이언트 연결됨 (WebRTC 모드)", job_id=job_id)
+    log.info("클라이언트 연결됨 (WebRTC 모드)")
 
-    await job_manager.update_status(job_id, JobStatus.PROCESSING)
+    # ✅ 상태 기록은 응답과 무관하므로 기다리지 않음 (accept 경로에서 DB 왕복 제거)
+    processing_write = fire_and_forget(job_manager.update_status(job_id, JobStatus.PROCESSING))
 
-    await websocket.send_json({
-        "type": "connection_success",
-        "message": f"Job {job_id}에 성공적으로 연결되었습니다.",
-        "vad_config": {
-            "sample_rate": constants.VAD_SAMPLE_RATE,
-            "frame_duration_ms": constants.VAD_FRAME_DURATION_MS
-        }
-    })
+    await send_encoded(
+        websocket,
+        render_template(_CONN_SUCCESS_TEMPLATES, encoding, job_id),
+        encoding
+    )
 
     # 3. 오디오 변환기 초기화
     audio_format = job.metadata.get("input_audio_format", "opus")
@@ -288,117 +387,145 @@ async def conversation_stream(
     input_sample_rate = job.metadata.get("input_sample_rate") or 48000
     input_channels = job.metadata.get("input_channels") or 2
 
-    # [디버깅용] 파일 저장 준비 (temp_audio 폴더에 저장)
-    debug_filename = f"debug_{job_id}.wav"
-    debug_file_path = os.path.join(settings.TEMP_AUDIO_DIR, debug_filename)
-
-    # 16k, 1ch, 16bit PCM 포맷으로 WAV 파일 열기
-    debug_wav = wave.open(debug_file_path, "wb")
-    debug_wav.setnchannels(1)  # 1 채널 (Mono)
-    debug_wav.setsampwidth(2)  # 2 Bytes (16-bit)
-    debug_wav.setframerate(16000)  # 16000 Hz
-
     try:
+        # ✅ 불변 설정은 입력 조합별로 캐시된 것을 공유, 디코더/버퍼만 연결마다 생성
         audio_converter = AudioStreamConverter(
-            target_sample_rate=constants.VAD_SAMPLE_RATE,
-            target_frame_duration_ms=constants.VAD_FRAME_DURATION_MS,
-            input_format=audio_format,
-            is_streaming_format=is_streaming,  # ✅ 추가
-            input_sample_rate=input_sample_rate,
-            input_channels=input_channels
+            get_converter_config(audio_format, is_streaming, input_sample_rate, input_channels)
         )
 
-        logger.info(
+        log.info(
             "AudioConverter 초기화 완료",
-            job_id=job_id,
             input_format=audio_format,
             is_streaming=is_streaming
         )
 
     except Exception as e:
         error_msg = f"AudioConverter 초기화 실패: {str(e)}"
-        logger.error("AudioConverter 초기화 실패", exc_info=True, error=str(e))
+        log.error("AudioConverter 초기화 실패", exc_info=True, error=str(e))
 
-        await websocket.send_json({
-            "type": "error",
-            "message": error_msg
-        })
-        await websocket.close(code=1011, reason=error_msg)
+        await close_with_error(websocket, error_msg)
         return
 
+    # [디버깅용] 수신 오디오 덤프 (settings.DEBUG_AUDIO_DUMP 일 때만)
+    # 수신 중에는 원본 PCM을 append-only로 기록하고 (청크당 write 1회),
+    # 종료 시 WAV 헤더를 붙여 변환 → 비정상 종료 시에도 .raw 파일은 온전히 남음
+    debug_fd: Optional[int] = None
+
+    if settings.DEBUG_AUDIO_DUMP:
+        debug_file_path = os.path.join(settings.TEMP_AUDIO_DIR, f"debug_{job_id}.wav")
+        debug_raw_path = debug_file_path + ".raw"
+        debug_fd = os.open(debug_raw_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
     # 4. Pipeline 생성 및 시작
-    pipeline = StreamPipeline(job, max_workers=3)
+    pipeline = StreamPipeline(job)
     await pipeline.start()
 
+    # ✅ 수신(producer)과 변환/VAD/STT/전송(consumer)을 분리
+    audio_queue: asyncio.Queue = asyncio.Queue(maxsize=constants.STREAM_RECV_QUEUE_SIZE)
+    receiver = asyncio.create_task(_receive_loop(websocket, audio_queue))
+
+    loop = asyncio.get_running_loop()
+    convert_in_thread = audio_converter.blocks_event_loop
+
     try:
         # --- 메인 루프: WebRTC 원본 스트림 수신 → 변환 → VAD → STT ---
         chunk_count = 0
+        chunk_error_counts = {}  # 예외 타입 → 발생 횟수
 
         while True:
-            # WebRTC에서 원본 오디오 수신
-            raw_audio_chunk = await websocket.receive_bytes()
+            # 수신 태스크가 받아 둔 원본 오디오 꺼내기
+            raw_audio_chunk = await audio_queue.get()
+
+            if raw_audio_chunk is None:
+                raise WebSocketDisconnect()
+            if isinstance(raw_audio_chunk, Exception):
+                raise raw_audio_chunk
+
             chunk_count += 1
 
-            # [디버깅 1] 받은 데이터를 그대로 WAV 파일에 기록
-            try:
-                debug_wav.writeframes(raw_audio_chunk)
-            except Exception as e:
-                logger.error("디버깅 파일 쓰기 실패", error=str(e))
+            if debug_fd is not None:
+                # [디버깅 1] 받은 데이터를 그대로 덤프 파일에 기록
+                os.write(debug_fd, raw_audio_chunk)
 
             # [디버깅 2] 데이터 샘플링 로그 (처음 5개 패킷만 상세 확인)
-            if chunk_count <= 5:
-                import numpy as np
-                # int16으로 해석 시도
-                data_np = np.frombuffer(raw_audio_chunk, dtype=np.int16)
-                logger.info(
+            if settings.AUDIO_DEBUG_STATS and chunk_count <= 5 and log.isEnabledFor(logging.INFO):
+                # int16으로 해석 시도 (Opus 패킷 등 홀수 길이는 마지막 바이트 제외)
+                data_np = np.frombuffer(raw_audio_chunk, dtype=np.int16, count=len(raw_audio_chunk) // 2)
+                sample_count = len(data_np)
+
+                if sample_count > 0:
+                    min_val, max_val = int(data_np.min()), int(data_np.max())
+                    # 평균은 합계로 계산 (float 배열 변환 없이 int64 누적)
+                    mean_val = int(data_np.sum(dtype=np.int64)) / sample_count
+                else:
+                    min_val = max_val = mean_val = 0
+
+                log.info(
                     "수신 데이터 분석",
                     chunk_num=chunk_count,
                     bytes_len=len(raw_audio_chunk),
-                    min_val=data_np.min() if len(data_np) > 0 else 0,
-                    max_val=data_np.max() if len(data_np) > 0 else 0,
-                    mean_val=data_np.mean() if len(data_np) > 0 else 0,
+                    min_val=min_val,
+                    max_val=max_val,
+                    mean_val=mean_val,
                     first_10_bytes=list(raw_audio_chunk[:10])  # 헤더 존재 여부 확인용
                 )
 
             # ★ 핵심: 원본 오디오를 VAD 요구사항에 맞게 변환
+            # ✅ 한 청크에서 나온 결과는 모아서 하나의 WebSocket 프레임으로 전송
+            pending_results = []
+
             try:
-                converted_frames = audio_converter.convert_and_buffer(raw_audio_chunk)
-
-                # 변환된 프레임들을 VAD/STT 파이프라인으로 전달
-                for frame in converted_frames:
-                    async for result in pipeline.process_audio_chunk(frame):
-                        try:
-                            await websocket.send_json(result)
-                        except Exception as send_error:
-                            logger.warning(
-                                "결과 전송 실패 (클라이언트 연결 끊김)",
-                                error=str(send_error)
-                            )
-                            raise WebSocketDisconnect()
+                if convert_in_thread:
+                    # ✅ 디코딩(libopus/FFmpeg)은 GIL을 놓는 네이티브 코드이므로 스레드에서 실행해
+                    # 이벤트 루프(수신 태스크, 다른 연결)가 멈추지 않도록 함
+                    converted_frames = await loop.run_in_executor(
+                        None, audio_converter.convert_and_buffer, raw_audio_chunk
+                    )
+                else:
+                    converted_frames = audio_converter.convert_and_buffer(raw_audio_chunk)
+
+                # 변환된 프레임들을 VAD/STT 파이프라인으로 한 번에 전달
+                if converted_frames:
+                    async for result in pipeline.process_audio_chunks(converted_frames):
+                        pending_results.append(result)
 
             except Exception as convert_error:
-                logger.warning(
-                    "오디오 변환 오류",
-                    chunk_number=chunk_count,
-                    error=str(convert_error)
-                )
+                # ✅ 같은 유형의 오류는 첫 발생만 traceback 포함 기록, 이후는 집계 (종료 시 한 번 출력)
+                error_type = type(convert_error).__name__
+                chunk_error_counts[error_type] = chunk_error_counts.get(error_type, 0) + 1
+
+                if chunk_error_counts[error_type] == 1:
+                    log.warning(
+                        "오디오 변환 오류",
+                        exc_info=True,
+                        chunk_number=chunk_count,
+                        error=str(convert_error)
+                    )
 
                 # 변환 실패 시에도 계속 진행 (일부 청크 손실 허용)
-                continue
+
+            if pending_results:
+                try:
+                    await send_messages(websocket, pending_results, encoding)
+                except Exception as send_error:
+                    log.warning(
+                        "결과 전송 실패 (클라이언트 연결 끊김)",
+                        error=str(send_error)
+                    )
+                    raise WebSocketDisconnect()
 
     except WebSocketDisconnect:
-        logger.info(
+        log.info(
             "클라이언트 연결 끊김",
-            job_id=job_id,
             chunks_received=chunk_count
         )
 
         # ✅ 남은 버퍼 처리 (패딩 및 프레임 분할 통합)
         try:
-            remaining_audio = audio_converter.flush()
+            # 비스트리밍 포맷은 여기서 전체 파일을 FFmpeg로 변환하므로 스레드에서 실행
+            remaining_audio = await loop.run_in_executor(None, audio_converter.flush)
             if remaining_audio:
-                # 1. 프레임 크기 계산 (960 bytes)
-                frame_size = int(constants.VAD_SAMPLE_RATE * (constants.VAD_FRAME_DURATION_MS / 1000.0) * 2)
+                frame_size = VAD_FRAME_BYTES
 
                 if is_streaming:
                     # -------------------------------------------------------
@@ -406,13 +533,16 @@ async def conversation_stream(
                     # -> 자투리가 남으면 패딩(0)을 채워서 처리
                     # -------------------------------------------------------
                     if len(remaining_audio) < frame_size:
-                        padding_size = frame_size - len(remaining_audio)
-                        remaining_audio += b'\x00' * padding_size  # 부족한 만큼 무음 추가
+                        # ✅ 0으로 초기화된 프레임 버퍼 하나에 복사 (무음 패딩 bytes 생성 + 연결 복사 생략)
+                        original_bytes = len(remaining_audio)
+                        frame_buf = bytearray(frame_size)
+                        frame_buf[:original_bytes] = remaining_audio
+                        remaining_audio = frame_buf
 
-                        logger.info(
+                        log.info(
                             "남은 오디오 패딩 적용",
-                            original_bytes=len(remaining_audio) - padding_size,
-                            padded_bytes=len(remaining_audio)
+                            original_bytes=original_bytes,
+                            padded_bytes=frame_size
                         )
 
                     # 패딩된 프레임(또는 딱 맞는 프레임) 처리
@@ -425,40 +555,43 @@ async def conversation_stream(
                     # -> 전체 파일을 프레임 단위(960bytes)로 쪼개서 처리
                     # -------------------------------------------------------
                     total_frames = len(remaining_audio) // frame_size
-                    logger.info(
+                    log.info(
                         "전체 파일 변환 완료, 프레임 분할 시작",
                         total_pcm_bytes=len(remaining_audio),
                         total_frames=total_frames
                     )
 
-                    for i in range(0, len(remaining_audio), frame_size):
-                        frame = remaining_audio[i:i + frame_size]
-                        if len(frame) < frame_size:
-                            break  # 마지막 불완전 프레임은 버림 (비스트리밍은 데이터가 충분하므로)
-
-                        async for result in pipeline.process_audio_chunk(frame):
-                            pass
+                    # ✅ 마지막 불완전 프레임은 범위에서 제외 (비스트리밍은 데이터가 충분하므로)
+                    # memoryview 슬라이스로 프레임마다 bytes를 복사하지 않음
+                    # (VAD/버퍼는 프레임을 즉시 자기 버퍼로 복사하고 참조를 보관하지 않음)
+                    audio_view = memoryview(remaining_audio)
+                    frames = [
+                        audio_view[i:i + frame_size]
+                        for i in range(0, total_frames * frame_size, frame_size)
+                    ]
+                    async for result in pipeline.process_audio_chunks(frames):
+                        pass
 
         except Exception as e:
-            logger.warning("남은 버퍼 처리 실패", error=str(e))
+            log.warning("남은 버퍼 처리 실패", error=str(e))
 
         # ✅ 최종 처리 (STT 완료 대기)
-        logger.info("최종 처리 시작 (STT 워커 완료 대기)", job_id=job_id)
+        log.info("최종 처리 시작 (STT 워커 완료 대기)")
+        # finalize가 기록하는 COMPLETED 상태보다 PROCESSING 기록이 먼저 끝나도록 보장
+        await asyncio.wait([processing_write])
         final_result = await pipeline.finalize()
 
         # 변환 통계 로깅
         converter_stats = audio_converter.get_stats()
-        logger.info(
+        log.info(
             "오디오 변환 통계",
-            job_id=job_id,
             **converter_stats
         )
 
         # ✅ 결과가 있으면 로깅 (WebSocket 전송은 불가)
         if final_result.get("type") == "final_summary":
-            logger.info(
+            log.info(
                 "최종 요약 완료 (WebSocket 끊김으로 클라이언트 전송 불가)",
-                job_id=job_id,
                 summary=final_result.get("summary"),
                 total_segments=final_result.get("total_segments")
             )
@@ -466,33 +599,48 @@ async def conversation_stream(
     except Exception as e:
         error_msg = f"예기치 않은 오류: {str(e)}"
 
-        logger.error("WebSocket 처리 오류", exc_info=True, error=str(e))
+        log.error("WebSocket 처리 오류", exc_info=True, error=str(e))
 
-        await job_manager.log_error(job_id, "websocket", error_msg)
+        fire_and_forget(job_manager.log_error(job_id, "websocket", error_msg))
+        # 이미 인식된 세그먼트는 버리지 않고 저장
+        await pipeline.stop_segment_writer()
+        # PROCESSING 기록이 COMPLETED를 덮어쓰지 않도록 먼저 끝난 것을 확인 (보통 이미 완료됨)
+        await asyncio.wait([processing_write])
+        # ✅ 아래 finally의 방 요약 트리거 확인이 COMPLETED를 보도록 직접 await
         await job_manager.update_status(job_id, JobStatus.COMPLETED, error_message=error_msg)
 
-        try:
-            await websocket.send_json({
-                "type": "error",
-                "message": error_msg
-            })
-        except:
-            pass
+        await close_with_error(websocket, error_msg)
 
     finally:
+        # 수신 태스크 정리 (전송 실패 등으로 소비자가 먼저 빠져나온 경우)
+        receiver.cancel()
+
+        if chunk_error_counts:
+            log.warning("청크 처리 오류 집계", error_counts=chunk_error_counts)
+
+        # [디버깅용] 덤프 파일 닫고 WAV로 변환
+        if debug_fd is not None:
+            os.close(debug_fd)
+            try:
+                await loop.run_in_executor(None, _finalize_debug_wav, debug_raw_path, debug_file_path)
+            except OSError as e:
+                log.error("디버깅 파일 변환 실패", error=str(e))
+
         # Job 정리
-        if job_id in active_jobs:
-            del active_jobs[job_id]
-            logger.info("스트림 작업 제거됨 (메모리 정리)", job_id=job_id)
+        if active_jobs.pop(job_id, None) is not None:
+            log.info("스트림 작업 제거됨 (메모리 정리)")
+
+        # ✅ 화상 회의 참가자 슬롯 해제 (같은 member_id로 재접속 가능)
+        if job.room_id and job.member_id:
+            await job_manager.release_member(job.room_id, job.member_id, job_id)
 
         # ✅ 화상 회의 모드인 경우 자동 요약 트리거 확인
         job = await job_manager.get_job(job_id)
         room_id = job.get("room_id")
 
         if room_id:
-            logger.info(
+            log.info(
                 "화상 회의 작업 종료, 자동 요약 확인",
-                job_id=job_id,
                 room_id=room_id,
                 final_status=job.get("status")
             )
@@ -501,13 +649,13 @@ async def conversation_stream(
             triggered = await job_manager.check_and_trigger_room_summary(room_id)
 
             if triggered:
-                logger.info(
+                log.info(
                     "방 통합 요약 트리거됨 (모든 작업 완료)",
                     room_id=room_id,
                     completed_job_id=job_id
                 )
             else:
-                logger.info(
+                log.info(
                     "방 통합 요약 대기 중 (다른 작업 진행 중)",
                     room_id=room_id,
                     completed_job_id=job_id
@@ -569,7 +717,7 @@ async def get_stream_stats(job_id: str):
         "job_id": job_id,
         "status": job.status,
         "segment_count": len(job.full_transcript),
-        "transcript_preview": " ".join(job.full_transcript[-3:])  # 최근 3개 세그먼트
+        "transcript_preview": job.preview_tail  # 최근 3개 세그먼트
     }
 
 
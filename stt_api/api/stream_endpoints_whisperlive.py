@@ -5,14 +5,33 @@ FrontData 객체 처리 추가 및 상태 공유 문제 해결
 """
 
 import asyncio
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
-from whisperlivekit import TranscriptionEngine, AudioProcessor
-
-from stt_api.core.config import settings
+import functools
+import gc
+import io
+import logging
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from fastapi import APIRouter, WebSocket, HTTPException, Query
+
+from stt_api.api.ws_protocol import (
+    build_templates,
+    close_with_error,
+    render_template,
+    send_encoded,
+    send_messages,
+    ENCODING_BINARY,
+    JOB_ID_PLACEHOLDER,
+    SUPPORTED_ENCODINGS
+)
+from stt_api.core.background_tasks import fire_and_forget
+from stt_api.core.config import settings, constants
 from stt_api.core.logging_config import get_logger
 from stt_api.services.llm import llm_service
 from stt_api.services.storage import job_manager, JobType, JobStatus
 
+if TYPE_CHECKING:
+    from whisperlivekit import TranscriptionEngine
+
 logger = get_logger(__name__)
 
 router = APIRouter()
@@ -20,16 +39,113 @@ router = APIRouter()
 # ❌ 전역 엔진 제거 (Stateful한 엔진을 공유하면 텐서 크기 불일치 발생)
 # _whisperlive_engine = None
 
+# ✅ 엔진 풀: 한 엔진은 한 연결만 사용 (동시 공유 없음), 연결이 끝나면 반납해 재사용
+#    연결마다 모델 가중치 로드 + CUDA 초기화를 반복하지 않음
+#    스트리밍 상태는 연결별 AudioProcessor에 있으므로 엔진은 그대로 반납
+_engine_pool: Optional[asyncio.Queue] = None
+_engine_sem: Optional[asyncio.Semaphore] = None
+
+# 연결 종료 후 남은 오디오 공급 + 결과 수집을 기다리는 최대 시간 (초)
+_DRAIN_TIMEOUT_SEC = 20.0
+
+# connection_success 메시지는 job_id / encoding 외에는 고정이므로 인코딩별로 한 번만 직렬화
+_CONN_SUCCESS_TEMPLATES = build_templates({
+    "type": "connection_success",
+    "message": f"Job {JOB_ID_PLACEHOLDER}에 연결되었습니다."
+})
+
+
+@functools.cache
+def _load_whisperlivekit() -> tuple:
+    """
+    whisperlivekit 지연 import (torch, faster-whisper 포함)
+
+    워커 기동 시점이 아니라 첫 엔진 생성 시점에 한 번만 로드합니다.
+    """
+    from whisperlivekit import TranscriptionEngine, AudioProcessor
+    return TranscriptionEngine, AudioProcessor
+
+
+def _create_engine() -> "TranscriptionEngine":
+    """엔진 인스턴스 생성 (모델 로드, 블로킹)"""
+    TranscriptionEngine, _ = _load_whisperlivekit()
+    return TranscriptionEngine(
+        model=settings.STT_MODEL_SIZE,
+        language=settings.STT_LANGUAGE,
+        diarization=settings.WHISPERLIVE_USE_DIARIZATION,
+        backend="faster_whisper",
+        device=settings.STT_DEVICE_TYPE,
+        compute_type=settings.STT_COMPUTE_TYPE,
+        # ✅ 두 번 연속 일치한 접두어만 확정하고, 확정된 세그먼트 이전 오디오는 버퍼에서 제거
+        #    (세션 길이에 비례해 재디코딩 비용이 늘어나지 않도록 디코딩 구간 제한)
+        backend_policy="localagreement",
+        buffer_trimming="segment",
+        buffer_trimming_sec=settings.WHISPERLIVE_BUFFER_TRIMMING_SEC
+    )
+
+
+async def _acquire_engine() -> "TranscriptionEngine":
+    """
+    유휴 엔진 대여 (없으면 WHISPERLIVE_MAX_ENGINES까지 새로 생성)
+
+    모든 엔진이 사용 중이면 반납될 때까지 대기합니다.
+    """
+    global _engine_pool, _engine_sem
+
+    if _engine_pool is None:
+        _engine_pool = asyncio.Queue()
+        _engine_sem = asyncio.Semaphore(settings.WHISPERLIVE_MAX_ENGINES)
+
+    await _engine_sem.acquire()
+
+    try:
+        return _engine_pool.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+
+    try:
+        logger.info("WhisperLiveKit 엔진 생성 (풀 확장)", model=settings.STT_MODEL_SIZE)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _create_engine)
+    except BaseException:
+        _engine_sem.release()
+        raise
+
+
+def _release_engine(engine: "TranscriptionEngine") -> None:
+    """
+    엔진 반납 (해당 연결의 AudioProcessor 정리 후 호출)
+
+    WHISPERLIVE_POOL_ENGINES가 꺼져 있으면 재사용하지 않고 버림 (연결마다 새 엔진)
+    """
+    if settings.WHISPERLIVE_POOL_ENGINES:
+        _engine_pool.put_nowait(engine)
+    _engine_sem.release()
+
+
+def _free_gpu_memory() -> None:
+    """
+    버린 엔진의 GPU 메모리 즉시 회수 (블로킹, 풀 미사용 시에만 호출)
+
+    참조 순환에 묶인 텐서를 gc로 정리한 뒤 PyTorch 캐시 할당자에 남은 블록을 반환합니다.
+    torch가 이미 로드된 경우에만 동작 (여기서 새로 import하지 않음)
+    """
+    gc.collect()
+
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
 
 @router.post("/api/v1/stream/create", status_code=201)
-def create_stream_job():
+async def create_stream_job():
     """스트림 작업 생성"""
     import uuid
 
     job_id = str(uuid.uuid4())
     metadata = {"stt_engine": "whisperlivekit"}
 
-    if not job_manager.create_job(job_id, JobType.REALTIME, metadata=metadata):
+    if not await job_manager.create_job(job_id, JobType.REALTIME, metadata=metadata):
         raise HTTPException(status_code=500, detail="작업 생성 실패")
 
     logger.info("새 스트림 작업 생성됨", job_id=job_id)
@@ -40,6 +156,63 @@ def create_stream_job():
     }
 
 
+def _extract_text_attr(result) -> str:
+    """TranscriptionResult: .text"""
+    text = result.text
+    if isinstance(text, str):
+        return text.strip()
+    return ""
+
+
+def _extract_lines(result) -> str:
+    """FrontData: .lines (dict 또는 str 리스트)"""
+    lines = result.lines
+    if not isinstance(lines, list) or not lines:
+        return ""
+
+    texts = []
+    for line in lines:
+        if isinstance(line, dict):
+            if 'text' in line:
+                texts.append(line['text'])
+        elif isinstance(line, str):
+            texts.append(line)
+
+    return " ".join(texts).strip()
+
+
+def _extract_buffer(result) -> str:
+    """FrontData 임시 버퍼: .buffer_transcription"""
+    buffer = result.buffer_transcription
+    if isinstance(buffer, str):
+        return buffer.strip()
+    if isinstance(buffer, list) and buffer:
+        return " ".join([str(b) for b in buffer]).strip()
+    return ""
+
+
+def _extract_content(result) -> str:
+    """.content (str 또는 {"text": ...})"""
+    content = result.content
+    if isinstance(content, str):
+        return content.strip()
+    if isinstance(content, dict) and 'text' in content:
+        return content['text'].strip()
+    return ""
+
+
+# 속성 이름 → 추출 함수 (우선순위 순)
+_EXTRACTORS = (
+    ("text", _extract_text_attr),
+    ("lines", _extract_lines),
+    ("buffer_transcription", _extract_buffer),
+    ("content", _extract_content),
+)
+
+# ✅ 결과 타입별로 적용 가능한 추출 함수 목록 캐시 (타입당 한 번만 속성 확인)
+_extractors_by_type: Dict[type, Tuple[Callable[[Any], str], ...]] = {}
+
+
 def extract_text_from_result(result) -> str:
     """
     WhisperLiveKit result 객체에서 텍스트 추출
@@ -47,57 +220,49 @@ def extract_text_from_result(result) -> str:
     환경에 따라 다른 객체 타입 반환:
     - TranscriptionResult: .text 속성
     - FrontData: .lines (리스트) 또는 .buffer_transcription
+
+    결과 타입을 처음 볼 때만 hasattr로 속성을 확인하고,
+    이후에는 캐시된 추출 함수만 순서대로 실행합니다.
+    (앞 함수 결과가 비어 있으면 다음 함수로 넘어감)
     """
-    # 1. text 속성 확인 (TranscriptionResult)
-    if hasattr(result, 'text'):
-        text = result.text
-        if isinstance(text, str) and text.strip():
-            return text.strip()
-
-    # 2. lines 속성 확인 (FrontData)
-    if hasattr(result, 'lines'):
-        lines = result.lines
-        if isinstance(lines, list) and len(lines) > 0:
-            texts = []
-            for line in lines:
-                if isinstance(line, dict):
-                    if 'text' in line:
-                        texts.append(line['text'])
-                elif isinstance(line, str):
-                    texts.append(line)
-
-            if texts:
-                return " ".join(texts).strip()
-
-    # 3. buffer_transcription 확인 (FrontData 임시 버퍼)
-    if hasattr(result, 'buffer_transcription'):
-        buffer = result.buffer_transcription
-        if isinstance(buffer, str) and buffer.strip():
-            return buffer.strip()
-        elif isinstance(buffer, list) and len(buffer) > 0:
-            return " ".join([str(b) for b in buffer]).strip()
-
-    # 4. content 속성 확인
-    if hasattr(result, 'content'):
-        content = result.content
-        if isinstance(content, str):
-            return content.strip()
-        elif isinstance(content, dict) and 'text' in content:
-            return content['text'].strip()
+    result_type = type(result)
+    extractors = _extractors_by_type.get(result_type)
+
+    if extractors is None:
+        extractors = tuple(
+            extractor for attr, extractor in _EXTRACTORS if hasattr(result, attr)
+        )
+        _extractors_by_type[result_type] = extractors
+
+    for extractor in extractors:
+        text = extractor(result)
+        if text:
+            return text
 
     return ""
 
 
 @router.websocket("/ws/v1/stream/{job_id}")
-async def whisperlive_stream(websocket: WebSocket, job_id: str):
+async def whisperlive_stream(
+    websocket: WebSocket,
+    job_id: str,
+    encoding: str = Query(ENCODING_BINARY, description="결과 인코딩 (orjson-bytes 또는 json)")
+):
     """
     ✅ WhisperLiveKit 전용 WebSocket 엔드포인트
 
     클라이언트 → 오디오 스트림 → WhisperLiveKit → 실시간 텍스트 반환
+
+    메시지 형식은 ws_protocol 참고
+    (transcript_segment는 STREAM_SEND_COALESCE_MS 동안 모아 batch 프레임으로 전송)
     """
+    if encoding not in SUPPORTED_ENCODINGS:
+        logger.error("지원하지 않는 인코딩으로 연결 시도", job_id=job_id, encoding=encoding)
+        await websocket.close(code=1008, reason="Unsupported encoding")
+        return
 
     # 1. 작업 확인
-    job = job_manager.get_job(job_id)
+    job = await job_manager.get_job(job_id)
     if not job:
         logger.error("존재하지 않는 Job ID", job_id=job_id)
         await websocket.close(code=1008, reason="Job ID not found")
@@ -107,49 +272,58 @@ async def whisperlive_stream(websocket: WebSocket, job_id: str):
     await websocket.accept()
     logger.info("클라이언트 연결됨", job_id=job_id)
 
-    job_manager.update_status(job_id, JobStatus.PROCESSING)
+    fire_and_forget(job_manager.update_status(job_id, JobStatus.PROCESSING))
 
-    await websocket.send_json({
-        "type": "connection_success",
-        "message": f"Job {job_id}에 연결되었습니다."
-    })
+    await send_encoded(websocket, render_template(_CONN_SUCCESS_TEMPLATES, encoding, job_id), encoding)
 
-    # 3. WhisperLiveKit 엔진 생성 (✅ 연결마다 독립적인 인스턴스 생성)
-    #    전역 엔진을 사용하면 KV Cache 충돌로 RuntimeError가 발생합니다.
+    # 3. WhisperLiveKit 엔진 대여 (✅ 연결 동안 독점 사용, 종료 시 풀에 반납)
+    #    여러 연결이 한 엔진을 동시에 쓰면 KV Cache 충돌로 RuntimeError가 발생합니다.
     try:
-        logger.info(
-            "WhisperLiveKit 엔진 초기화 (개별 연결용)",
-            job_id=job_id,
-            model=settings.STT_MODEL_SIZE
-        )
-
-        # 엔진 인스턴스 생성
-        engine = TranscriptionEngine(
-            model=settings.STT_MODEL_SIZE,
-            language=settings.STT_LANGUAGE,
-            diarization=settings.WHISPERLIVE_USE_DIARIZATION,
-            backend="faster_whisper",
-            device=settings.STT_DEVICE_TYPE
-        )
+        engine = await _acquire_engine()
+        logger.info("WhisperLiveKit 엔진 할당", job_id=job_id, model=settings.STT_MODEL_SIZE)
 
     except Exception as e:
         error_msg = f"엔진 초기화 실패: {str(e)}"
         logger.error("엔진 초기화 실패", exc_info=True, error=str(e))
-        await websocket.send_json({"type": "error", "message": error_msg})
-        await websocket.close(code=1011, reason=error_msg)
+        await close_with_error(websocket, error_msg)
         return
 
     # 4. AudioProcessor 생성
-    audio_processor = AudioProcessor(transcription_engine=engine)
-    result_generator = await audio_processor.create_tasks()
-
-    # 5. 대화록 수집
-    transcript_segments = []
+    try:
+        _, AudioProcessor = _load_whisperlivekit()
+        audio_processor = AudioProcessor(transcription_engine=engine)
+        result_generator = await audio_processor.create_tasks()
+    except BaseException:
+        _release_engine(engine)
+        raise
+
+    # 5. 대화록 수집 (✅ 세그먼트 리스트 + join 대신 단일 버퍼에 이어 쓰기)
+    transcript_buf = io.StringIO()
     segment_count = 0
 
+    # ✅ 전송 대기 중인 세그먼트 (짧은 시간 모아서 한 프레임으로 전송)
+    pending_results = []
+    flush_task: Optional[asyncio.Task] = None
+    send_failed = False
+
+    async def flush_pending_results():
+        nonlocal send_failed
+        # 전송 중에 새로 쌓인 세그먼트도 이어서 처리
+        while pending_results and not send_failed:
+            await asyncio.sleep(constants.STREAM_SEND_COALESCE_MS / 1000)
+
+            items = pending_results[:]
+            pending_results.clear()
+
+            try:
+                await send_messages(websocket, items, encoding)
+            except Exception as send_error:
+                logger.warning("전송 실패", error=str(send_error))
+                send_failed = True
+
     # ✅ 백그라운드: 결과 수집 & WebSocket 전송
     async def collect_and_send_results():
-        nonlocal segment_count
+        nonlocal segment_count, flush_task
         try:
             async for result in result_generator:
                 text = extract_text_from_result(result)
@@ -158,84 +332,162 @@ async def whisperlive_stream(websocket: WebSocket, job_id: str):
                     continue
 
                 segment_count += 1
-                transcript_segments.append(text)
-
-                logger.info(
-                    "세그먼트 감지",
-                    job_id=job_id,
-                    segment_number=segment_count,
-                    text_preview=text[:50]
-                )
-
-                try:
-                    await websocket.send_json({
-                        "type": "transcript_segment",
-                        "text": text,
-                        "segment_number": segment_count
-                    })
-                except Exception as send_error:
-                    logger.warning("전송 실패", error=str(send_error))
+                if transcript_buf.tell():
+                    transcript_buf.write(" ")
+                transcript_buf.write(text)
+
+                # ✅ 세그먼트마다 로그를 남기지 않고 N건마다 한 번만 기록
+                if (
+                        segment_count % constants.STREAM_LOG_SAMPLE_EVERY == 0
+                        and logger.isEnabledFor(logging.INFO)
+                ):
+                    logger.info(
+                        "세그먼트 감지",
+                        job_id=job_id,
+                        segment_number=segment_count,
+                        text_length=len(text)
+                    )
+
+                if send_failed:
                     break
 
+                pending_results.append({
+                    "type": "transcript_segment",
+                    "text": text,
+                    "segment_number": segment_count
+                })
+
+                if flush_task is None or flush_task.done():
+                    flush_task = asyncio.create_task(flush_pending_results())
+
         except asyncio.CancelledError:
             logger.info("결과 수집 종료", job_id=job_id)
         except Exception as e:
             logger.error("결과 수집 오류", exc_info=True, error=str(e))
+        finally:
+            # 모아 둔 마지막 세그먼트까지 전송
+            if flush_task is not None:
+                await asyncio.wait([flush_task])
+
+    # ✅ 수신 ↔ STT 분리: 수신 루프는 큐에 넣기만 하고, 별도 태스크가 엔진에 공급
+    #    (엔진이 밀려도 소켓 수신이 멈추지 않음, None은 종료 신호)
+    audio_queue: asyncio.Queue = asyncio.Queue(maxsize=constants.STREAM_RECV_QUEUE_SIZE)
+
+    async def feed_audio_processor():
+        processed = 0
+        error_count = 0
+        while True:
+            audio_chunk = await audio_queue.get()
+            if audio_chunk is None:
+                # 빈 청크 = 엔진의 스트림 종료 신호 (결과 생성기가 남은 버퍼를 처리하고 끝남)
+                await audio_processor.process_audio(b"")
+                return
+
+            processed += 1
+            try:
+                await audio_processor.process_audio(audio_chunk)
+            except Exception as process_error:
+                # 같은 오류가 청크마다 반복될 수 있으므로 첫 오류와 이후 N건마다만 기록
+                error_count += 1
+                if error_count == 1 or error_count % constants.STREAM_LOG_SAMPLE_EVERY == 0:
+                    logger.warning(
+                        "오디오 처리 오류",
+                        job_id=job_id,
+                        chunk_number=processed,
+                        error_count=error_count,
+                        error=str(process_error)
+                    )
+
+    chunk_count = 0
+    dropped_chunks = 0
+
+    # ✅ 메인 루프: 클라이언트로부터 오디오 수신
+    async def receive_audio():
+        nonlocal chunk_count, dropped_chunks
+
+        # ✅ iter_bytes는 연결 종료 시 예외 없이 반복을 끝냄
+        # 수신 청크(bytes)는 복사 없이 그대로 큐에 넣음
+        # - Starlette가 프레임마다 bytes를 새로 만들기 때문에 재사용 버퍼 풀에 옮기면 복사만 1회 늘어남
+        # - AudioProcessor가 청크 참조를 내부 큐에 보관할 수 있어 반납 후 재사용하면 데이터가 오염됨
+        async for audio_chunk in websocket.iter_bytes():
+            # 빈 프레임(keepalive)은 버림 (엔진에는 빈 청크가 스트림 종료 신호일 수 있음)
+            if not audio_chunk:
+                continue
+            if len(audio_chunk) > constants.STREAM_MAX_CHUNK_BYTES:
+                logger.warning("오디오 프레임 크기 초과", job_id=job_id, chunk_bytes=len(audio_chunk))
+                await close_with_error(websocket, "Audio frame too large", code=1009)
+                break
+
+            chunk_count += 1
+
+            try:
+                audio_queue.put_nowait(audio_chunk)
+            except asyncio.QueueFull:
+                # 큐가 가득 차면 가장 오래된 청크를 버림 (음성 구간 감지가 곧 회복)
+                audio_queue.get_nowait()
+                audio_queue.put_nowait(audio_chunk)
+                dropped_chunks += 1
+
+        logger.info(
+            "클라이언트 연결 끊김",
+            job_id=job_id,
+            chunks_received=chunk_count,
+            chunks_dropped=dropped_chunks
+        )
 
-    # 6. 백그라운드 태스크 시작
-    result_task = asyncio.create_task(collect_and_send_results())
+        # 종료 신호: 큐에 남은 오디오를 엔진에 모두 넘긴 뒤 공급 태스크 종료
+        await audio_queue.put(None)
 
     try:
-        # ✅ 메인 루프: 클라이언트로부터 오디오 수신
         logger.info("오디오 스트림 수신 시작", job_id=job_id)
 
-        chunk_count = 0
-        while True:
-            audio_chunk = await websocket.receive_bytes()
-            chunk_count += 1
+        # 6. ✅ 수집/공급 태스크를 TaskGroup으로 묶어 수명 관리
+        #    (수신 중 오류가 나면 두 태스크 모두 취소되고 끝날 때까지 대기)
+        #    연결 종료 후에는 남은 버퍼 처리를 _DRAIN_TIMEOUT_SEC까지만 기다림
+        async with asyncio.timeout(None) as drain_deadline:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(collect_and_send_results())
+                tg.create_task(feed_audio_processor())
 
-            try:
-                await audio_processor.process_audio(audio_chunk)
-            except Exception as process_error:
-                logger.warning(
-                    "오디오 처리 오류",
-                    chunk_number=chunk_count,
-                    error=str(process_error)
-                )
+                await receive_audio()
 
-    except WebSocketDisconnect:
-        logger.info("클라이언트 연결 끊김", job_id=job_id, chunks_received=chunk_count)
+                logger.info("최종 처리 시작", job_id=job_id)
+                drain_deadline.reschedule(asyncio.get_running_loop().time() + _DRAIN_TIMEOUT_SEC)
 
-    except Exception as e:
-        error_msg = f"스트리밍 오류: {str(e)}"
-        logger.error("스트리밍 오류", exc_info=True, error=str(e))
-        job_manager.log_error(job_id, "whisperlive_stream", error_msg)
+    except* TimeoutError:
+        logger.warning("남은 오디오/결과 처리 타임아웃", job_id=job_id)
+
+    except* Exception as eg:
+        error = eg.exceptions[0]
+        error_msg = f"스트리밍 오류: {str(error)}"
+        logger.error("스트리밍 오류", exc_info=error, error=str(error))
+        fire_and_forget(job_manager.log_error(job_id, "whisperlive_stream", error_msg))
 
     finally:
         # 7. 정리 작업
-        logger.info("최종 처리 시작", job_id=job_id)
-
-        try:
-            # 10초 대기 (남은 버퍼 처리)
-            await asyncio.wait_for(result_task, timeout=10.0)
-        except asyncio.TimeoutError:
-            logger.warning("결과 수집 타임아웃", job_id=job_id)
-            result_task.cancel()
+        # 연결별 스트리밍 상태 정리 후 엔진 반납 (가중치는 유지)
+        cleanup = getattr(audio_processor, "cleanup", None)
+        if cleanup is not None:
             try:
-                await result_task
-            except asyncio.CancelledError:
-                pass
+                await cleanup()
+            except Exception as e:
+                logger.warning("AudioProcessor 정리 실패", job_id=job_id, error=str(e))
+        _release_engine(engine)
+
+        # 이 핸들러(및 내부 클로저)가 잡고 있던 참조 해제
+        # (del은 클로저 셀이 남아 있어 참조가 풀리지 않으므로 None 대입)
+        engine = audio_processor = result_generator = cleanup = None
 
-        # 엔진 정리 (메모리 해제 유도)
-        del audio_processor
-        del engine
+        if not settings.WHISPERLIVE_POOL_ENGINES:
+            await asyncio.get_running_loop().run_in_executor(None, _free_gpu_memory)
 
         # 8. 전체 대화록 생성
-        full_transcript = " ".join(transcript_segments)
+        full_transcript = transcript_buf.getvalue()
+        transcript_buf.close()
 
         if not full_transcript:
             logger.warning("대화 내용 없음", job_id=job_id)
-            job_manager.update_status(
+            await job_manager.update_status(
                 job_id,
                 JobStatus.TRANSCRIBED,
                 transcript="",
@@ -244,7 +496,7 @@ async def whisperlive_stream(websocket: WebSocket, job_id: str):
             return
 
         # STT 완료
-        job_manager.update_status(
+        await job_manager.update_status(
             job_id,
             JobStatus.TRANSCRIBED,
             transcript=full_transcript
@@ -257,31 +509,42 @@ async def whisperlive_stream(websocket: WebSocket, job_id: str):
             transcript_length=len(full_transcript)
         )
 
-        # 9. 요약 생성
-        try:
-            logger.info("요약 시작", job_id=job_id)
-            summary_dict = await llm_service.get_summary(full_transcript)
+        # 9. 요약 생성 (✅ 백그라운드 실행: 핸들러는 LLM 응답을 기다리지 않고 바로 종료)
+        fire_and_forget(
+            _run_summary(job_id, full_transcript, segment_count),
+            name=f"whisperlive-summary-{job_id}"
+        )
 
-            job_manager.update_status(
-                job_id,
-                JobStatus.COMPLETED,
-                summary=summary_dict
-            )
 
-            logger.info("요약 완료", job_id=job_id)
+async def _run_summary(job_id: str, full_transcript: str, segment_count: int) -> None:
+    """
+    대화록 요약 후 COMPLETED 기록
 
-            try:
-                await websocket.send_json({
-                    "type": "final_summary",
-                    "summary": summary_dict,
-                    "total_segments": segment_count
-                })
-            except:
-                pass
+    연결이 끊긴 뒤 실행되므로 결과는 WebSocket 대신 이벤트(SSE 구독자)로 발행합니다.
+    """
+    try:
+        logger.info("요약 시작", job_id=job_id)
+        summary_dict = await llm_service.get_summary(full_transcript)
 
-        except Exception as e:
-            error_msg = f"요약 실패: {str(e)}"
-            logger.error("요약 실패", exc_info=True, error=str(e))
-            job_manager.log_error(job_id, "summary", error_msg)
+        # ✅ COMPLETED를 먼저 기록한 뒤 발행 (이벤트를 받고 결과를 조회하는 클라이언트가 이전 상태를 보지 않도록)
+        await job_manager.update_status(
+            job_id,
+            JobStatus.COMPLETED,
+            summary=summary_dict
+        )
+
+        job_manager.publish_event(job_id, {
+            "type": "final_summary",
+            "summary": summary_dict,
+            "segment_count": segment_count,
+            "status": JobStatus.COMPLETED.value
+        })
+
+        logger.info("요약 완료", job_id=job_id)
+
+    except Exception as e:
+        error_msg = f"요약 실패: {str(e)}"
+        logger.error("요약 실패", exc_info=True, job_id=job_id, error=str(e))
+        await job_manager.log_error(job_id, "summary", error_msg)
 
-        logger.info("작업 완료", job_id=job_id)
\ No newline at end of file
+    logger.info("작업 완료", job_id=job_id)
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+WebSocket 메시지 직렬화/전송 헬퍼
+
+와이어 프로토콜:
+- 단일 메시지: {"type": "...", ...}
+- 배치 메시지: {"type": "batch", "items": [{...}, {...}]}
+  한 번의 수신 청크에서 결과가 여러 개 나오면 하나의 프레임으로 묶어 전송합니다.
+  클라이언트는 type == "batch" 인 경우 items[]를 풀어서 개별 메시지처럼 처리해야 합니다.
+  (결과가 1개뿐이면 기존처럼 단일 메시지로 전송)
+
+오류 종료:
+- 처리 중 오류는 별도 error 메시지 없이 close code 1011 + reason(최대 123 bytes)으로 전달
+
+인코딩 (connection_success 메시지의 "encoding" 필드로 안내):
+- "orjson-bytes" (기본): orjson으로 직렬화한 JSON을 바이너리 프레임으로 전송
+- "json": 텍스트 프레임으로 전송 (바이너리 프레임을 처리하지 못하는 클라이언트용,
+  연결 시 ?encoding=json 쿼리 파라미터로 선택)
+"""
+
+from typing import Any, Dict, List
+
+import orjson
+from fastapi import WebSocket
+
+from stt_api.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_MESSAGE_TYPE = "batch"
+
+# RFC 6455: close frame payload 125 bytes - status code 2 bytes
+MAX_CLOSE_REASON_BYTES = 123
+
+ENCODING_BINARY = "orjson-bytes"
+ENCODING_TEXT = "json"
+SUPPORTED_ENCODINGS = (ENCODING_BINARY, ENCODING_TEXT)
+
+# 미리 직렬화해 둔 메시지 템플릿에서 연결마다 job_id로 바꿔 넣을 자리
+JOB_ID_PLACEHOLDER = "__JOB_ID__"
+
+
+def encode_message(payload: Dict[str, Any]) -> bytes:
+    """메시지를 JSON bytes로 직렬화 (stdlib json 대신 orjson)"""
+    return orjson.dumps(payload)
+
+
+def build_templates(payload: Dict[str, Any]) -> Dict[str, bytes]:
+    """
+    job_id 외에는 고정인 메시지를 인코딩별로 한 번만 직렬화
+
+    payload의 job_id 자리에는 JOB_ID_PLACEHOLDER를 넣고, "encoding" 필드는 인코딩별로 채워짐
+    전송 시 render_template()로 job_id만 치환합니다.
+    """
+    return {
+        encoding: encode_message({**payload, "encoding": encoding})
+        for encoding in SUPPORTED_ENCODINGS
+    }
+
+
+def render_template(templates: Dict[str, bytes], encoding: str, job_id: str) -> bytes:
+    """build_templates()로 만든 템플릿에 job_id 치환"""
+    return templates[encoding].replace(JOB_ID_PLACEHOLDER.encode(), job_id.encode())
+
+
+async def send_message(
+        websocket: WebSocket,
+        payload: Dict[str, Any],
+        encoding: str = ENCODING_BINARY
+) -> None:
+    """
+    단일 메시지 전송
+
+    Args:
+        websocket: 대상 WebSocket
+        payload: 전송할 메시지
+        encoding: ENCODING_BINARY(바이너리 프레임) 또는 ENCODING_TEXT(텍스트 프레임)
+    """
+    await send_encoded(websocket, encode_message(payload), encoding)
+
+
+async def send_encoded(
+        websocket: WebSocket,
+        data: bytes,
+        encoding: str = ENCODING_BINARY
+) -> None:
+    """
+    이미 직렬화된 메시지 전송 (미리 만들어 둔 템플릿 등)
+
+    Args:
+        websocket: 대상 WebSocket
+        data: encode_message()로 직렬화된 JSON bytes
+        encoding: ENCODING_BINARY(바이너리 프레임) 또는 ENCODING_TEXT(텍스트 프레임)
+    """
+    if encoding == ENCODING_TEXT:
+        await websocket.send_text(data.decode())
+    else:
+        # ✅ UTF-8 디코딩/재인코딩 없이 그대로 전송
+        await websocket.send_bytes(data)
+
+
+async def send_messages(
+        websocket: WebSocket,
+        items: List[Dict[str, Any]],
+        encoding: str = ENCODING_BINARY
+) -> None:
+    """
+    여러 메시지를 하나의 프레임으로 묶어 전송
+
+    Args:
+        websocket: 대상 WebSocket
+        items: 전송할 메시지 목록 (비어 있으면 아무것도 보내지 않음)
+        encoding: ENCODING_BINARY(바이너리 프레임) 또는 ENCODING_TEXT(텍스트 프레임)
+    """
+    if not items:
+        return
+
+    if len(items) == 1:
+        await send_message(websocket, items[0], encoding)
+        return
+
+    await send_message(websocket, {"type": BATCH_MESSAGE_TYPE, "items": items}, encoding)
+
+
+async def close_with_error(websocket: WebSocket, reason: str, code: int = 1011) -> None:
+    """
+    오류를 close code/reason으로 전달하며 연결 종료
+
+    reason은 UTF-8 기준 123 bytes로 잘라냄 (한글은 글자당 3 bytes, 잘린 글자는 버림)
+    이미 끊긴 연결이면 아무것도 하지 않음
+    """
+    reason = reason.encode("utf-8")[:MAX_CLOSE_REASON_BYTES].decode("utf-8", "ignore")
+
+    try:
+        await websocket.close(code=code, reason=reason)
+    except Exception as e:
+        logger.debug("WebSocket 종료 생략 (이미 닫힘)", error=str(e))
+
@@ -0,0 +1,75 @@
+"""
+요청 경로에서 기다릴 필요 없는 비동기 작업 실행기
+
+상태 전이/에러 로그 기록처럼 클라이언트 응답과 무관한 DB/Redis 쓰기를
+백그라운드 태스크로 돌려 핸들러가 왕복 시간만큼 멈추지 않도록 합니다.
+
+- 실행 중인 태스크는 모듈 집합에 보관 (GC로 인한 태스크 유실 방지)
+- 서버 종료 시 drain()으로 남은 쓰기를 기다린 뒤 DB 연결을 닫음
+- 이후 로직이 결과에 의존하는 쓰기(create_job 등)는 여기에 넣지 말고 직접 await
+"""
+
+import asyncio
+from typing import Coroutine, Optional, Set
+
+from stt_api.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def fire_and_forget(coro: Coroutine, name: Optional[str] = None) -> asyncio.Task:
+    """
+    코루틴을 백그라운드 태스크로 실행 (실행 중인 이벤트 루프 안에서 호출)
+
+    Args:
+        coro: 실행할 코루틴 (예: job_manager.update_status(...))
+        name: 로그용 태스크 이름
+
+    Returns:
+        생성된 태스크 (보통은 무시해도 됨)
+    """
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+def _on_task_done(task: asyncio.Task) -> None:
+    """완료된 태스크 제거 + 처리되지 않은 예외 로깅"""
+    _background_tasks.discard(task)
+
+    if task.cancelled():
+        return
+
+    error = task.exception()
+    if error is not None:
+        logger.error(
+            "백그라운드 작업 실패",
+            task_name=task.get_name(),
+            error=str(error)
+        )
+
+
+async def drain(timeout: float = 10.0) -> None:
+    """
+    남은 백그라운드 태스크 완료 대기 (서버 종료 시 호출)
+
+    timeout 안에 끝나지 않은 태스크는 취소합니다.
+    """
+    if not _background_tasks:
+        return
+
+    pending_count = len(_background_tasks)
+    done, pending = await asyncio.wait(set(_background_tasks), timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+
+    logger.info(
+        "백그라운드 작업 정리 완료",
+        total=pending_count,
+        completed=len(done),
+        cancelled=len(pending)
+    )
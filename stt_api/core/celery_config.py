@@ -1,4 +1,9 @@
+import asyncio
+import threading
+from typing import Optional, Callable, Awaitable, List
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 from stt_api.core.config import settings
 from stt_api.core.config import constants
 
@@ -21,4 +26,107 @@ celery_app = Celery(
 # 이것이 훨씬 더 유연하고 강력합니다.
 
 # (선택) 시간대 설정
-celery_app.conf.timezone = constants.CELERY_TIMEZONE
\ No newline at end of file
+celery_app.conf.timezone = constants.CELERY_TIMEZONE
+
+# 4. 큐 라우팅
+# STT 파이프라인은 모델 추론(GPU/CPU 바운드)이 대부분이라 기본 prefork 워커에 두고,
+# 통합 요약은 DB 조회 + LLM HTTP 호출 대기가 대부분이라 별도 큐로 분리합니다.
+# 요약 큐는 threads 풀 워커(-P threads)가 높은 동시성으로 처리합니다.
+# (eventlet/gevent 몽키패치는 태스크 내부의 asyncio.run 과 충돌하므로 사용하지 않습니다)
+celery_app.conf.task_default_queue = constants.CELERY_STT_QUEUE
+celery_app.conf.task_routes = {
+    'stt_api.services.tasks.generate_room_summary_task': {
+        'queue': constants.CELERY_SUMMARY_QUEUE
+    },
+}
+
+
+# 5. 워커 프로세스 전용 이벤트 루프
+# 태스크마다 asyncio.run 으로 루프를 만들고 부수는 대신,
+# 워커 프로세스마다 백그라운드 스레드에서 도는 루프 하나를 재사용합니다.
+# (threads 풀에서는 여러 태스크의 await가 이 루프 하나에서 동시에 진행됩니다)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+# 루프 정지 직전에 실행할 정리 코루틴 (공용 HTTP 클라이언트 종료 등)
+_worker_loop_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """워커 루프 반환 (없으면 생성 후 백그라운드 스레드에서 실행)"""
+    global _worker_loop
+
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="celery-event-loop",
+                daemon=True
+            ).start()
+            _worker_loop = loop
+
+        return _worker_loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    """
+    prefork 자식 프로세스 시작 시 루프를 미리 띄움 (부모에서 상속된 상태는 버림)
+
+    DB 연결 풀도 부모에서 복사된 것은 폐기 (자식은 자기 워커 루프에서 새 연결을 만들어 쓰고,
+    부모 소유의 소켓은 닫지 않고 버리기만 함: close=False)
+    """
+    from stt_api.core.database import engine
+
+    engine.sync_engine.dispose(close=False)
+
+    global _worker_loop
+    _worker_loop = None
+    _get_worker_loop()
+
+
+def on_worker_loop_shutdown(hook: Callable[[], Awaitable[None]]):
+    """워커 루프 정지 직전에 실행할 정리 코루틴 함수 등록"""
+    _worker_loop_shutdown_hooks.append(hook)
+    return hook
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_worker_loop(**kwargs):
+    """
+    워커 프로세스 종료 시 정리 훅 실행 후 루프 정지
+
+    prefork 자식은 worker_process_shutdown, threads 풀(단일 프로세스)은 worker_shutdown으로 호출됨
+    (prefork 부모의 worker_shutdown에서는 루프가 없으므로 아무것도 하지 않음)
+    """
+    global _worker_loop
+
+    with _worker_loop_lock:
+        loop = _worker_loop
+        _worker_loop = None
+
+    if loop is None or not loop.is_running():
+        return
+
+    for hook in _worker_loop_shutdown_hooks:
+        try:
+            asyncio.run_coroutine_threadsafe(hook(), loop).result(timeout=5)
+        except Exception:
+            pass
+
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def run_in_worker_loop(coro):
+    """
+    동기 컨텍스트(Celery Task)에서 코루틴을 워커 루프에 제출하고 결과를 기다림
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 반환값 (예외는 그대로 전파)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
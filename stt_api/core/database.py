@@ -1,7 +1,7 @@
 """
 데이터베이스 연결 및 세션 관리
 
-SQLAlchemy + aiomysql을 사용한 비동기 DB 연결
+SQLAlchemy + aiomysql(또는 asyncmy, settings.DB_ASYNC_DRIVER)을 사용한 비동기 DB 연결
 """
 
 from sqlalchemy.ext.asyncio import (
@@ -9,29 +9,46 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker
 )
-from sqlalchemy.pool import NullPool
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import DeclarativeBase
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import time
+from typing import AsyncGenerator, Tuple
+import orjson
 from sqlalchemy import text
 
-from stt_api.core.config import settings
+from stt_api.core.config import settings, constants
 from stt_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 # ==================== SQLAlchemy Base ====================
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """ORM 모델 공통 Base (SQLAlchemy 2.x 선언형)"""
+    pass
+
 
 # ==================== 비동기 엔진 생성 ====================
+def _orjson_dumps_str(value) -> str:
+    """JSON 컬럼 바인딩용 직렬화 (드라이버에는 str로 전달)"""
+    return orjson.dumps(value).decode()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,  # SQL 쿼리 로깅
-    # ✅ [변경] Celery 등 멀티 프로세스/루프 환경에서는 풀링을 비활성화(NullPool)해야 안전합니다.
-    poolclass=NullPool,
+    # ✅ 연결 풀 재사용 (요청마다 TCP 연결 + MySQL 인증 왕복을 반복하지 않음)
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,  # 서버 측에서 끊긴 연결 감지
+    # ✅ 짧은 단건 쓰기 위주라 REPEATABLE READ의 갭 락이 필요 없음 (동시 INSERT 대기 감소)
+    isolation_level="READ COMMITTED",
+    # ✅ JSON 컬럼(요약/메타데이터) 직렬화에 stdlib json 대신 orjson 사용
+    json_serializer=_orjson_dumps_str,
+    json_deserializer=orjson.loads,
 )
 
+
 # ==================== 세션 팩토리 ====================
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -140,19 +157,34 @@ async def get_transaction() -> AsyncGenerator[AsyncSession, None]:
 
 
 # ==================== 헬스 체크 ====================
+# (확인 시각, 결과) - 로드밸런서가 자주 호출해도 TTL 동안은 실제 쿼리를 생략
+_health_cache: Tuple[float, bool] = (float("-inf"), False)
+
+
 async def check_database_health() -> bool:
     """
     데이터베이스 연결 상태 확인
 
     헬스 체크 엔드포인트에서 사용됩니다.
+    constants.DB_HEALTH_CACHE_TTL_SEC 안의 재호출은 직전 결과를 그대로 반환합니다.
 
     Returns:
         연결 정상 여부
     """
+    global _health_cache
+
+    checked_at, healthy = _health_cache
+    now = time.monotonic()
+    if now - checked_at < constants.DB_HEALTH_CACHE_TTL_SEC:
+        return healthy
+
     try:
-        async with engine.begin() as conn:
+        async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
-        return True
+        healthy = True
     except Exception as e:
         logger.warning("DB 헬스 체크 실패", error=str(e))
-        return False
\ No newline at end of file
+        healthy = False
+
+    _health_cache = (now, healthy)
+    return healthy
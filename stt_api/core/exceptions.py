@@ -16,8 +16,11 @@ class CustomException(Exception):
         message: 에러 메시지
         details: 추가 상세 정보
         error_code: 에러 코드 (선택)
+        http_status: API 응답 HTTP 상태 코드 (하위 클래스에서 재정의)
     """
 
+    http_status: int = 500
+
     def __init__(
             self,
             message: str,
@@ -49,6 +52,8 @@ class StorageException(CustomException):
 class JobNotFoundException(StorageException):
     """Job not found in storage"""
 
+    http_status = 404  # Not Found
+
     def __init__(self, job_id: str):
         super().__init__(
             message=f"Job {job_id}를 찾을 수 없습니다",
@@ -99,6 +104,8 @@ class ModelNotLoadedError(STTException):
 class STTProcessingError(STTException):
     """STT processing failed"""
 
+    http_status = 500  # Internal Server Error
+
     def __init__(self, file_path: str, reason: str):
         super().__init__(
             message=f"STT 처리 실패: {reason}",
@@ -128,6 +135,8 @@ class LLMException(CustomException):
 class LLMConnectionError(LLMException):
     """Failed to connect to LLM service"""
 
+    http_status = 503  # Service Unavailable
+
     def __init__(self, service_name: str, reason: str):
         super().__init__(
             message=f"{service_name} 연결 실패: {reason}",
@@ -171,6 +180,8 @@ class FileException(CustomException):
 class FileValidationError(FileException):
     """File validation failed"""
 
+    http_status = 400  # Bad Request
+
     def __init__(self, filename: str, reason: str):
         super().__init__(
             message=f"파일 검증 실패: {reason}",
@@ -182,6 +193,8 @@ class FileValidationError(FileException):
 class FileSizeExceededError(FileException):
     """File size exceeds limit"""
 
+    http_status = 413  # Request Entity Too Large
+
     def __init__(self, size: int, max_size: int):
         super().__init__(
             message=f"파일 크기가 제한을 초과했습니다",
@@ -196,6 +209,8 @@ class FileSizeExceededError(FileException):
 class UnsupportedFileTypeError(FileException):
     """Unsupported file type"""
 
+    http_status = 415  # Unsupported Media Type
+
     def __init__(self, file_type: str, allowed_types: list):
         super().__init__(
             message=f"지원하지 않는 파일 형식입니다",
@@ -0,0 +1,90 @@
+"""
+인메모리 스트리밍 작업 레지스트리
+
+POST /api/v1/stream/create 로 만든 StreamingJob은 WebSocket 연결 전까지
+이 레지스트리만 참조하므로, 클라이언트가 연결하지 않으면 영원히 남습니다.
+
+- 연결 전(pending) 작업: 등록 후 ttl_sec이 지나면 만료
+- 연결 중(pinned) 작업: 만료/축출 대상 아님 (별도 dict로 옮겨 두고, 연결 종료 시 pop으로 제거)
+- 전체 개수가 max_size를 넘으면 가장 오래된 pending 작업부터 축출
+
+만료 검사는 등록 시점에 pending 작업만 등록 순서대로 앞에서부터 확인하므로 O(만료 개수)입니다.
+
+모든 접근은 API 프로세스의 이벤트 루프 스레드 하나에서 await 없이 일어나므로
+락이나 샤딩이 필요 없습니다. 다른 스레드(run_in_executor 등)에서 건드리지 마세요.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ActiveJobRegistry(Generic[T]):
+    """TTL + 최대 개수로 크기가 제한되는 job_id → 작업 객체 저장소"""
+
+    def __init__(self, max_size: int, ttl_sec: float):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        # 연결 전 작업: job_id → (등록 시각, 작업), 등록 순서 유지
+        self._pending: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+        # 연결 중 작업: 만료 검사 대상이 아니므로 등록 순서 목록에서 빼 둠
+        self._pinned: Dict[str, T] = {}
+
+    def add(self, job_id: str, job: T) -> List[T]:
+        """
+        작업 등록
+
+        Returns:
+            이번 등록으로 만료/축출된 pending 작업 목록 (호출 측에서 후처리)
+        """
+        evicted = self._evict(time.monotonic())
+        self._pinned.pop(job_id, None)
+        self._pending[job_id] = (time.monotonic(), job)
+        self._pending.move_to_end(job_id)
+        return evicted
+
+    def pin(self, job_id: str) -> None:
+        """연결된 작업 고정 (만료/축출 제외)"""
+        entry = self._pending.pop(job_id, None)
+        if entry is not None:
+            self._pinned[job_id] = entry[1]
+
+    def get(self, job_id: str) -> Optional[T]:
+        job = self._pinned.get(job_id)
+        if job is not None:
+            return job
+        entry = self._pending.get(job_id)
+        return entry[1] if entry is not None else None
+
+    def pop(self, job_id: str, default: Optional[T] = None) -> Optional[T]:
+        job = self._pinned.pop(job_id, None)
+        if job is not None:
+            return job
+        entry = self._pending.pop(job_id, None)
+        return entry[1] if entry is not None else default
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._pinned or job_id in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._pinned)
+
+    def _evict(self, now: float) -> List[T]:
+        """만료된 pending 작업 제거 + 여유 공간 1개 확보"""
+        evicted: List[T] = []
+        pending = self._pending
+
+        while pending:
+            job_id, (registered_at, job) = next(iter(pending.items()))
+            expired = now - registered_at >= self.ttl_sec
+            over_capacity = len(pending) + len(self._pinned) >= self.max_size
+
+            if not expired and not over_capacity:
+                break  # 이후 항목은 더 최근에 등록됨
+
+            del pending[job_id]
+            evicted.append(job)
+
+        return evicted
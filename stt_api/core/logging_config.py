@@ -7,7 +7,7 @@ JSON 형식의 로그를 출력하여 ELK, Datadog 등의
 
 import logging
 import sys
-import json
+import orjson
 from datetime import datetime
 from typing import Any, Dict, Optional
 from stt_api.core.config import settings
@@ -48,7 +48,8 @@ class JSONFormatter(logging.Formatter):
         if record.stack_info:
             log_data["stack_trace"] = self.formatStack(record.stack_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        # ✅ orjson 직렬화 (직렬화할 수 없는 컨텍스트 값은 str()로 기록)
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -158,10 +159,31 @@ class StructuredLogger:
     사용 예시:
         logger = StructuredLogger(__name__)
         logger.info("작업 시작", job_id="abc-123", user_id=42)
+
+        # 연결/작업 단위로 공통 컨텍스트를 한 번만 바인딩
+        log = logger.bind(job_id="abc-123")
+        log.info("청크 수신", chunk_num=1)
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, context: Optional[Dict[str, Any]] = None):
         self.logger = logging.getLogger(name)
+        self.context = context or {}
+
+    def bind(self, **context: Any) -> "StructuredLogger":
+        """
+        공통 컨텍스트가 바인딩된 새 로거 반환
+
+        Args:
+            **context: 이후 모든 로그에 포함될 필드 (예: job_id)
+
+        Returns:
+            같은 로거 이름을 쓰는 StructuredLogger
+        """
+        return StructuredLogger(self.logger.name, {**self.context, **context})
+
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 레벨 로그가 출력되는지 여부 (비싼 인자 계산을 건너뛸 때 사용)"""
+        return self.logger.isEnabledFor(level)
 
     def _log(
             self,
@@ -171,6 +193,13 @@ class StructuredLogger:
             **context: Any
     ) -> None:
         """내부 로그 메서드"""
+        # ✅ 출력되지 않을 레벨이면 컨텍스트 병합/LogRecord 생성 생략
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if self.context:
+            context = {**self.context, **context}
+
         # extra를 통해 추가 컨텍스트 전달
         extra = {"extra_data": context} if context else {}
         self.logger.log(level, message, exc_info=exc_info, extra=extra)
@@ -1,3 +1,4 @@
+import logging
 import uuid
 import time
 from typing import List, Dict, Optional
@@ -6,6 +7,25 @@ from stt_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# ✅ VADProcessor 클래스 (첫 faster-whisper 작업 생성 시 한 번만 import)
+# stt_api.services → pipeline → streaming_job 순환 import를 피하려고 모듈 최상단에서 import하지 않음
+_VADProcessor = None
+
+
+def _get_vad_processor_class():
+    global _VADProcessor
+    if _VADProcessor is None:
+        from stt_api.services.stt.vad_processor import VADProcessor
+        _VADProcessor = VADProcessor
+    return _VADProcessor
+
+
+# ✅ 작업마다 settings/constants를 다시 읽지 않도록 프로세스 시작 시 한 번만 계산
+_USE_VAD = settings.STT_ENGINE == "faster-whisper"
+_VAD_SAMPLE_RATE = constants.VAD_SAMPLE_RATE
+_VAD_FRAME_DURATION_MS = constants.VAD_FRAME_DURATION_MS
+_BUFFER_THRESHOLD = 16000 * 2 * 1  # 1초치 오디오 (16kHz, 16-bit)
+
 
 class StreamingJob:
     """
@@ -14,39 +34,39 @@ class StreamingJob:
     ✅ faster-whisper와 WhisperLiveKit 모두 지원
     """
 
-    def __init__(self, metadata: Dict = None):
-        self.job_id: str = str(uuid.uuid4())
+    def __init__(self, metadata: Dict = None, room_id: str = None, member_id: str = None):
+        self.job_id: str = uuid.uuid4().hex  # 하이픈 없는 32자 (DB job_id 컬럼 36자 이내)
         self.metadata: Dict = metadata or {}
 
+        # ✅ 화상 회의 모드 (참가자 슬롯 해제용)
+        self.room_id: Optional[str] = room_id
+        self.member_id: Optional[str] = member_id
+
         self.start_time: float = time.time()
 
         # ✅ STT 엔진에 따라 다른 초기화
-        self.use_vad = settings.STT_ENGINE == "faster-whisper"
+        self.use_vad = _USE_VAD
 
         if self.use_vad:
             # --- faster-whisper 모드: VAD 사용 ---
-            from stt_api.services.stt.vad_processor import VADProcessor
-
-            self.vad_processor = VADProcessor(
-                sample_rate=constants.VAD_SAMPLE_RATE,
-                frame_duration_ms=constants.VAD_FRAME_DURATION_MS,
-                vad_aggressiveness=constants.VAD_AGGRESSIVENESS,
-                min_speech_frames=constants.VAD_MIN_SPEECH_FRAMES,
-                max_silence_frames=constants.VAD_MAX_SILENCE_FRAMES
-            )
+            # (Silero VADProcessor는 VAD 설정을 constants에서 직접 읽음)
+            self.vad_processor = _get_vad_processor_class()()
+            self._process_vad_chunk = self.vad_processor.process_chunk  # 청크마다 속성 조회 생략
             self.audio_buffer = None
 
             logger.info(
                 "StreamingJob 생성 (faster-whisper 모드)",
                 job_id=self.job_id,
-                vad_sample_rate=constants.VAD_SAMPLE_RATE,
-                vad_frame_duration=constants.VAD_FRAME_DURATION_MS
+                vad_sample_rate=_VAD_SAMPLE_RATE,
+                vad_frame_duration=_VAD_FRAME_DURATION_MS
             )
         else:
             # --- WhisperLiveKit 모드: VAD 불필요, 버퍼만 사용 ---
             self.vad_processor = None
-            self.audio_buffer = bytearray()  # 청크를 누적할 버퍼
-            self.buffer_threshold = 16000 * 2 * 1  # 1초치 오디오 (16kHz, 16-bit)
+            self.buffer_threshold = _BUFFER_THRESHOLD
+            # ✅ 임계값 크기로 미리 할당해 두고 재사용 (extend/clear로 인한 재할당 방지)
+            self.audio_buffer = bytearray(self.buffer_threshold)
+            self._buf_len = 0  # audio_buffer 중 실제로 채워진 길이
 
             logger.info(
                 "StreamingJob 생성 (WhisperLiveKit 모드)",
@@ -57,6 +77,7 @@ class StreamingJob:
         # 공통 속성
         self.full_transcript: List[str] = []
         self.current_prompt_context: str = ""
+        self.preview_tail: str = ""  # ✅ 최근 3개 세그먼트 미리보기 (세그먼트 추가 시 갱신)
         self.status: str = "processing"
 
     def process_audio_chunk(self, audio_chunk: bytes) -> Optional[tuple]:
@@ -74,36 +95,58 @@ class StreamingJob:
 
         if self.use_vad:
             # --- faster-whisper 모드: VAD 처리 ---
-            segment_bytes = self.vad_processor.process_chunk(audio_chunk)
+            segment_bytes = self._process_vad_chunk(audio_chunk)
             if segment_bytes:
-                logger.debug(
-                    "VAD 음성 세그먼트 감지",
-                    job_id=self.job_id,
-                    timestamp=chunk_timestamp,
-                    segment_bytes=len(segment_bytes)
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "VAD 음성 세그먼트 감지",
+                        job_id=self.job_id,
+                        timestamp=chunk_timestamp,
+                        segment_bytes=len(segment_bytes)
+                    )
                 return segment_bytes, chunk_timestamp
             return None
 
         else:
             # --- WhisperLiveKit 모드: 버퍼 누적 ---
-            self.audio_buffer.extend(audio_chunk)
-
-            # 버퍼가 임계값을 넘으면 반환
-            if len(self.audio_buffer) >= self.buffer_threshold:
-                segment_bytes = bytes(self.audio_buffer)
-                self.audio_buffer.clear()
-
-                logger.debug(
-                    "버퍼 임계값 도달, 세그먼트 반환",
-                    job_id=self.job_id,
-                    timestamp=chunk_timestamp,
-                    segment_bytes=len(segment_bytes)
-                )
+            end = self._buf_len + len(audio_chunk)
+
+            # 이번 청크로 임계값에 도달하면 누적분 + 청크를 한 번에 반환
+            if end >= self.buffer_threshold:
+                segment_bytes = self._take_buffer(audio_chunk)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "버퍼 임계값 도달, 세그먼트 반환",
+                        job_id=self.job_id,
+                        timestamp=chunk_timestamp,
+                        segment_bytes=len(segment_bytes)
+                    )
                 return segment_bytes, chunk_timestamp
 
+            self.audio_buffer[self._buf_len:end] = audio_chunk
+            self._buf_len = end
             return None
 
+    def _take_buffer(self, tail: bytes = b"") -> bytearray:
+        """
+        채워진 버퍼를 복사 없이 넘기고 새 버퍼로 교체 (WhisperLiveKit 모드)
+
+        Args:
+            tail: 버퍼 뒤에 이어 붙일 청크 (버퍼에 들어가지 않는 마지막 청크)
+
+        Returns:
+            누적 오디오 + tail (bytearray, 소비 측은 bytes-like로만 사용)
+        """
+        segment = self.audio_buffer
+        del segment[self._buf_len:]  # 채워지지 않은 뒷부분만 잘라냄
+        if tail:
+            segment += tail
+
+        self.audio_buffer = bytearray(self.buffer_threshold)
+        self._buf_len = 0
+        return segment
+
     def flush_buffer(self) -> Optional[tuple]:
         """
         ✅ 연결 종료 시 남은 버퍼 강제 반환
@@ -120,15 +163,15 @@ class StreamingJob:
                     return segment_bytes, flush_timestamp
         else:
             # WhisperLiveKit: 오디오 버퍼 flush
-            if len(self.audio_buffer) > 0:
-                segment_bytes = bytes(self.audio_buffer)
-                self.audio_buffer.clear()
-
-                logger.debug(
-                    "버퍼 flush",
-                    job_id=self.job_id,
-                    segment_bytes=len(segment_bytes)
-                )
+            if self._buf_len > 0:
+                segment_bytes = self._take_buffer()
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "버퍼 flush",
+                        job_id=self.job_id,
+                        segment_bytes=len(segment_bytes)
+                    )
                 return segment_bytes, flush_timestamp
 
         return None
@@ -145,6 +188,17 @@ class StreamingJob:
         """
         return absolute_timestamp - self.start_time
 
+    def append_transcript(self, segment_text: str) -> None:
+        """
+        인식된 세그먼트를 대화록에 추가하고 STT 문맥 / 미리보기 갱신
+
+        Args:
+            segment_text: 인식된 세그먼트 텍스트
+        """
+        self.current_prompt_context += " " + segment_text
+        self.full_transcript.append(segment_text)
+        self.preview_tail = " ".join(self.full_transcript[-3:])
+
     def get_full_transcript(self) -> str:
         """전체 대화록 반환"""
         return " ".join(self.full_transcript)
\ No newline at end of file
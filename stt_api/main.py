@@ -1,7 +1,8 @@
 import os
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 # ✅ 로깅 및 예외 처리 임포트
@@ -10,16 +11,19 @@ from stt_api.core.exceptions import CustomException
 
 # ✅ 데이터베이스 임포트
 from stt_api.core.database import init_database, close_database, check_database_health
+from stt_api.core import background_tasks
 
 # 서비스 모듈
 from stt_api.services.llm import llm_service
 from stt_api.services.stt import whisper_service
+from stt_api.services.pipeline import batch_job_queue
+from stt_api.services.storage import job_manager
 
 # 라우터
 from stt_api.api import batch_endpoints
 
 # 설정
-from stt_api.core.config import settings
+from stt_api.core.config import settings, constants
 
 # ✅ 로거 인스턴스 생성
 logger = get_logger(__name__)
@@ -67,6 +71,10 @@ async def lifespan(app: FastAPI):
         await llm_service.check_connection()
         logger.info("LLM 서비스 연결 완료")
 
+        # 5. 인프로세스 배치 큐 (Celery 대신 사용하도록 설정된 경우)
+        if settings.BATCH_EXECUTOR == "inprocess":
+            batch_job_queue.start(settings.BATCH_INPROCESS_WORKERS)
+
         logger.info("서버 초기화 완료", host=settings.HOST, port=settings.PORT)
 
     except Exception as e:
@@ -78,6 +86,15 @@ async def lifespan(app: FastAPI):
     # --- 서버 종료 시 ---
     logger.info("서버 종료 중...")
 
+    # ✅ 인프로세스 배치 큐 종료
+    await batch_job_queue.stop()
+
+    # ✅ LLM 공용 HTTP 클라이언트 종료
+    await llm_service.close()
+
+    # ✅ 남은 상태/에러 로그 기록 완료 대기 (DB 연결 종료 전)
+    await background_tasks.drain()
+
     # ✅ 데이터베이스 연결 종료
     await close_database()
 
@@ -91,7 +108,8 @@ app = FastAPI(
     description="음성 대화 STT 및 요약 비동기 API",
     version=settings.API_VERSION,
     lifespan=lifespan,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse  # ✅ 응답 직렬화에 orjson 사용
 )
 
 
@@ -111,22 +129,11 @@ async def custom_exception_handler(request: Request, exc: CustomException):
         method=request.method
     )
 
-    # HTTP 상태 코드 매핑
-    status_code_map = {
-        "JobNotFoundException": status.HTTP_404_NOT_FOUND,
-        "FileValidationError": status.HTTP_400_BAD_REQUEST,
-        "FileSizeExceededError": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-        "UnsupportedFileTypeError": status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-        "LLMConnectionError": status.HTTP_503_SERVICE_UNAVAILABLE,
-        "STTProcessingError": status.HTTP_500_INTERNAL_SERVER_ERROR,
-    }
+    # ✅ HTTP 상태 코드는 예외 클래스 속성으로 정의됨 (exceptions.py)
+    status_code = exc.http_status
 
-    status_code = status_code_map.get(
-        exc.__class__.__name__,
-        status.HTTP_500_INTERNAL_SERVER_ERROR
-    )
-
-    return JSONResponse(
+    # ✅ 오류 응답 직렬화는 orjson으로 (stdlib json 대신)
+    return ORJSONResponse(
         status_code=status_code,
         content=exc.to_dict()
     )
@@ -173,7 +180,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     else:
         error_detail = str(exc)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
@@ -189,29 +196,28 @@ async def log_requests(request: Request, call_next):
     """
     ✅ 모든 HTTP 요청/응답 로깅 미들웨어
     """
-    import time
-
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    client = request.client
 
     # 요청 로깅
     logger.info(
         "HTTP 요청 수신",
         method=request.method,
         path=request.url.path,
-        client_ip=request.client.host if request.client else "unknown"
+        client_ip=client.host if client else "unknown"
     )
 
     # 요청 처리
     response = await call_next(request)
 
-    # 응답 로깅
-    duration_ms = (time.time() - start_time) * 1000
+    # 응답 로깅 (단조 시계 기준, 마이크로초 단위까지)
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000 / 1_000
     logger.info(
         "HTTP 응답 전송",
         method=request.method,
         path=request.url.path,
         status_code=response.status_code,
-        duration_ms=round(duration_ms, 2)
+        duration_ms=duration_ms
     )
 
     return response
@@ -235,8 +241,6 @@ async def health_check():
     """
     ✅ 헬스 체크 엔드포인트 (DB 연결 확인 추가)
     """
-    from stt_api.services.storage import job_manager
-
     # Redis 연결 확인
     redis_status = "ok"
     try:
@@ -288,6 +292,7 @@ app.include_router(
 # ==================== 서버 시작 정보 ====================
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     logger.info("Uvicorn 서버 시작 (직접 실행 모드)")
@@ -296,5 +301,15 @@ if __name__ == "__main__":
         "stt_api.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # ✅ 이벤트 루프/WebSocket 구현 고정 (auto는 설치 여부에 따라 asyncio/wsproto로 떨어질 수 있음)
+        # - uvloop: libuv 기반 이벤트 루프 (소켓 I/O·태스크 스케줄링 C 구현)
+        # - websockets: C 확장으로 프레임 마스킹/파싱 처리
+        # 운영 환경에서는 PYTHONASYNCIODEBUG를 설정하지 않음 (태스크마다 생성 위치 추적 비용)
+        loop="uvloop" if sys.platform != "win32" else "asyncio",  # uvloop은 Windows 미지원
+        ws="websockets",
+        # ✅ Opus/PCM 오디오 프레임은 deflate로 거의 줄지 않고 CPU만 소모하므로 비활성화
+        ws_per_message_deflate=False,
+        # ✅ 프레임 크기 상한 (기본 16MiB, 오디오 청크는 수 KB라 1MiB면 충분)
+        ws_max_size=constants.STREAM_MAX_CHUNK_BYTES
     )
\ No newline at end of file
@@ -103,6 +103,8 @@ class STTJob(Base):
     __table_args__ = (
         Index('idx_job_type_status', 'job_type', 'status'),
         Index('idx_room_member', 'room_id', 'member_id'),
+        # ✅ 방 단위 상태별 작업 목록 (room_id + status 조건, reg_dttm 정렬)을 filesort 없이 인덱스 순서로 조회
+        Index('idx_room_status_regdttm', 'room_id', 'status', 'reg_dttm'),
         {'comment': 'STT 작업 및 요약 상태 관리'}
     )
 
@@ -259,7 +261,8 @@ class STTErrorLog(Base):
 
     # 인덱스 정의
     __table_args__ = (
-        Index('idx_job_error', 'job_id'),
+        # ✅ 작업별 최근 에러 조회 (job_id 조건, reg_dttm DESC 정렬)를 filesort 없이 처리
+        Index('idx_errlog_job_dttm', 'job_id', 'reg_dttm'),
         Index('idx_service_name', 'service_name'),
         {'comment': 'STT 서비스 에러 로그 테이블'}
     )
@@ -4,9 +4,11 @@
 
 import av
 import numpy as np
-from typing import Optional, List
+import soxr
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, List
 from io import BytesIO
-from pydub import AudioSegment
 
 from stt_api.core.config import constants
 from stt_api.core.logging_config import get_logger
@@ -15,6 +17,135 @@ from stt_api.core.exceptions import AudioFormatError
 logger = get_logger(__name__)
 
 
+def _downmix_s16(samples: np.ndarray, channels: int) -> np.ndarray:
+    """
+    인터리브된 int16 샘플을 모노로 (채널 평균)
+
+    ✅ mean()의 float64 중간 배열 대신 int32로 더한 뒤 나눔 (채널은 strided view로 접근)
+    """
+    if channels <= 1:
+        return samples
+
+    frames = samples.reshape(-1, channels)
+    mixed = frames[:, 0].astype(np.int32)
+    for channel in range(1, channels):
+        mixed += frames[:, channel]
+
+    if channels == 2:
+        mixed >>= 1
+    else:
+        mixed //= channels
+
+    return mixed.astype(np.int16)
+
+
+@lru_cache(maxsize=None)
+def _get_decoder_codec(codec_name: str) -> "av.codec.Codec":
+    """
+    디코더 코덱 조회 (프로세스 전체에서 공유)
+
+    ✅ 스트림마다 FFmpeg 코덱 이름 조회를 반복하지 않고, 디코더 컨텍스트만 스트림별로 생성
+    (디코딩/리샘플링 상태는 스트림마다 달라야 하므로 컨텍스트와 리샘플러는 공유하지 않음)
+    """
+    return av.codec.Codec(codec_name, "r")
+
+
+def _decode_container(data: bytes, target_sample_rate: int) -> np.ndarray:
+    """
+    컨테이너/압축 오디오(MP3, AAC 등)를 통째로 디코딩해 int16 모노 샘플로 변환
+
+    ✅ pydub(AudioSegment.from_file)은 호출마다 ffmpeg 프로세스를 새로 띄우므로,
+    같은 FFmpeg 라이브러리를 PyAV로 프로세스 안에서 호출 (포맷은 내용으로 자동 판별)
+    """
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=target_sample_rate)
+    chunks = []
+
+    with av.open(BytesIO(data)) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+
+    # 리샘플러에 남은 샘플 배출
+    for resampled in resampler.resample(None):
+        chunks.append(resampled.to_ndarray().reshape(-1))
+
+    if not chunks:
+        return np.empty(0, dtype=np.int16)
+    return np.concatenate(chunks)
+
+
+def _select_strategy(input_format: str, is_streaming_format: bool) -> str:
+    """
+    입력 포맷에 따라 최적 전략 선택
+
+    Returns:
+        "numpy" | "pyav" | "container"
+    """
+    # 1. Raw PCM → NumPy 직접 처리 (가장 빠름)
+    if input_format in ["pcm", "pcm_s16le", "raw"]:
+        return "numpy"
+
+    # 2. Opus/WebM → PyAV 스트리밍 (안정적)
+    if input_format in ["opus", "webm"] and is_streaming_format:
+        return "pyav"
+
+    # 3. 기타/MP3 → PyAV 컨테이너 디코딩 폴백 (호환성)
+    return "container"
+
+
+@dataclass(frozen=True)
+class ConverterConfig:
+    """
+    변환기 불변 설정
+
+    입력 포맷 조합별로 한 번만 계산하여 연결 간 공유하고,
+    디코더/리샘플러/버퍼 같은 상태는 AudioStreamConverter 인스턴스가 가짐
+    """
+    input_format: str
+    is_streaming_format: bool
+    input_sample_rate: int
+    input_channels: int
+    target_sample_rate: int
+    target_frame_duration_ms: int
+    target_frame_bytes: int
+    strategy: str
+
+
+@lru_cache(maxsize=16)
+def get_converter_config(
+        input_format: str = "opus",
+        is_streaming_format: bool = True,
+        input_sample_rate: int = 48000,
+        input_channels: int = 2,
+        target_sample_rate: int = constants.VAD_SAMPLE_RATE,
+        target_frame_duration_ms: int = constants.VAD_FRAME_DURATION_MS
+) -> ConverterConfig:
+    """
+    입력 조합별 변환기 설정 조회 (LRU 캐시)
+
+    Args:
+        input_format: 입력 오디오 포맷 (opus, pcm, webm, mp3 등)
+        is_streaming_format: 청크 단위 실시간 변환 가능 여부
+        input_sample_rate: 입력 샘플레이트
+        input_channels: 입력 채널 수
+        target_sample_rate: 출력 샘플레이트 (VAD 요구사항)
+        target_frame_duration_ms: 출력 프레임 길이 (VAD 요구사항)
+    """
+    input_format = input_format.lower()
+
+    return ConverterConfig(
+        input_format=input_format,
+        is_streaming_format=is_streaming_format,
+        input_sample_rate=input_sample_rate,
+        input_channels=input_channels,
+        target_sample_rate=target_sample_rate,
+        target_frame_duration_ms=target_frame_duration_ms,
+        # 목표 프레임 크기 (16-bit mono)
+        target_frame_bytes=target_sample_rate * target_frame_duration_ms * 2 // 1000,
+        strategy=_select_strategy(input_format, is_streaming_format)
+    )
+
+
 class AudioStreamConverter:
     """
     WebRTC 스트림 변환기 (하이브리드 방식)
@@ -22,72 +153,82 @@ class AudioStreamConverter:
     전략:
     - Raw PCM: NumPy 직접 처리 (가장 빠름)
     - Opus/WebM: PyAV 스트리밍 디코딩 (안정적)
-    - MP3/AAC: Pydub 일괄 처리 (호환성)
+    - MP3/AAC: PyAV 컨테이너 일괄 디코딩 (호환성)
+
+    사용 예시:
+        converter = AudioStreamConverter(get_converter_config("opus", True, 48000, 2))
     """
 
-    def __init__(
-        self,
-        target_sample_rate: int = constants.VAD_SAMPLE_RATE,
-        target_frame_duration_ms: int = constants.VAD_FRAME_DURATION_MS,
-        input_format: str = "opus",
-        is_streaming_format: bool = True,
-        input_sample_rate: int = 48000,
-        input_channels: int = 2
-    ):
-        self.target_sample_rate = target_sample_rate
-        self.target_frame_duration_ms = target_frame_duration_ms
-        self.input_format = input_format.lower()
-        self.is_streaming_format = is_streaming_format
-        self.input_sample_rate = input_sample_rate
-        self.input_channels = input_channels
-
-        # 목표 프레임 크기
-        self.target_frame_bytes = int(
-            target_sample_rate * (target_frame_duration_ms / 1000.0) * 2
-        )
+    def __init__(self, config: ConverterConfig):
+        self.config = config
+        self.target_sample_rate = config.target_sample_rate
+        self.target_frame_duration_ms = config.target_frame_duration_ms
+        self.input_format = config.input_format
+        self.is_streaming_format = config.is_streaming_format
+        self.input_sample_rate = config.input_sample_rate
+        self.input_channels = config.input_channels
+        self.target_frame_bytes = config.target_frame_bytes
 
         # 내부 버퍼
-        self.buffer = bytearray()
-        self.raw_buffer = bytearray() if not is_streaming_format else None
+        # ✅ 변환된 16-bit PCM 샘플 버퍼 (미리 할당한 int16 배열 + 읽기/쓰기 위치)
+        # 프레임마다 bytearray 앞부분을 del로 당기는(memmove) 대신 읽기 위치만 전진시키고,
+        # 뒤쪽 공간이 모자랄 때만 남은 샘플을 앞으로 한 번 옮김
+        self.frame_samples = self.target_frame_bytes // 2
+        self._pcm = np.empty(self.target_sample_rate, dtype=np.int16)  # 약 1초 (부족하면 확장)
+        self._read = 0
+        self._write = 0
+        self.raw_buffer = bytearray() if not self.is_streaming_format else None
 
         # 통계
         self.total_received_bytes = 0
         self.total_output_frames = 0
+        # 청크 단위 오류 집계 ("메시지:예외타입" → 발생 횟수)
+        self.error_counts: Dict[str, int] = {}
 
-        # ✅ 전략 선택
-        self.strategy = self._select_strategy()
+        # ✅ 전략 (PyAV 디코더 초기화 실패 시 인스턴스별로 컨테이너 디코딩 폴백)
+        self.strategy = config.strategy
 
         # ✅ PyAV 디코더 (Opus/WebM용)
         self.decoder = None
         self.resampler = None
 
+        # ✅ Raw PCM용 스트리밍 리샘플러 (soxr: SIMD FIR, 청크 경계 간 필터 상태 유지)
+        self.pcm_resampler = None
+
         if self.strategy == "pyav":
             self._init_pyav()
+        elif self.strategy == "numpy" and self.input_sample_rate != self.target_sample_rate:
+            self.pcm_resampler = soxr.ResampleStream(
+                self.input_sample_rate,
+                self.target_sample_rate,
+                1,
+                dtype="int16",
+                quality=constants.RESAMPLER_QUALITY
+            )
+
+        # ✅ 전략은 스트림 동안 바뀌지 않으므로 처리 메서드를 한 번만 골라 둠 (패킷마다 분기 생략)
+        self._process_chunk = {
+            "numpy": self._process_numpy,
+            "pyav": self._process_pyav,
+            "container": self._process_container,
+        }[self.strategy]
 
         logger.info(
             "AudioStreamConverter 초기화",
             strategy=self.strategy,
-            input_format=input_format,
-            target_sample_rate=target_sample_rate
+            input_format=self.input_format,
+            target_sample_rate=self.target_sample_rate
         )
 
-    def _select_strategy(self) -> str:
+    @property
+    def blocks_event_loop(self) -> bool:
         """
-        입력 포맷에 따라 최적 전략 선택
+        변환이 이벤트 루프를 막을 만큼 무거운지 여부
 
-        Returns:
-            "numpy" | "pyav" | "pydub"
+        NumPy 경로와 비스트리밍 포맷(원본 누적만 함)은 그대로 호출하고,
+        PyAV(libopus 디코딩)/컨테이너 디코딩(FFmpeg 디먹서+디코더)은 호출부에서 스레드로 넘겨야 함
         """
-        # 1. Raw PCM → NumPy 직접 처리 (가장 빠름)
-        if self.input_format in ["pcm", "pcm_s16le", "raw"]:
-            return "numpy"
-
-        # 2. Opus/WebM → PyAV 스트리밍 (안정적)
-        if self.input_format in ["opus", "webm"] and self.is_streaming_format:
-            return "pyav"
-
-        # 3. 기타/MP3 → Pydub 폴백 (호환성)
-        return "pydub"
+        return self.is_streaming_format and self.strategy != "numpy"
 
     def _init_pyav(self):
         """PyAV 디코더 초기화 (Opus/WebM용)"""
@@ -95,11 +236,12 @@ class AudioStreamConverter:
             # ✅ [핵심 수정] Opus는 Parser를 통해 처리해야 함
             if self.input_format == "opus":
                 # Opus 디코더 생성 (옵션 없이)
-                self.decoder = av.CodecContext.create("libopus", "r")
+                codec_name = "libopus"
 
             else:  # webm
                 codec_name = "vp8"
-                self.decoder = av.CodecContext.create(codec_name, "r")
+
+            self.decoder = av.CodecContext.create(_get_decoder_codec(codec_name))
 
             # 리샘플러 생성
             self.resampler = av.AudioResampler(
@@ -111,14 +253,17 @@ class AudioStreamConverter:
             logger.info("PyAV 디코더 초기화 완료", codec=self.input_format)
 
         except Exception as e:
-            logger.warning(f"PyAV 초기화 실패, Pydub로 폴백: {e}")
-            self.strategy = "pydub"
+            logger.warning(f"PyAV 초기화 실패, 컨테이너 디코딩으로 폴백: {e}")
+            self.strategy = "container"
 
     def convert_and_buffer(self, raw_audio_chunk: bytes) -> List[bytes]:
         """
         오디오 청크 변환
 
         전략별 분기 처리
+
+        Returns:
+            30ms 프레임 목록 (bytes 호환 memoryview, 한 번의 호출에서 나온 프레임은 같은 블록을 공유)
         """
         if not raw_audio_chunk:
             return []
@@ -131,46 +276,45 @@ class AudioStreamConverter:
             return []
 
         try:
-            # ✅ 전략별 처리
-            if self.strategy == "numpy":
-                return self._process_numpy(raw_audio_chunk)
-            elif self.strategy == "pyav":
-                return self._process_pyav(raw_audio_chunk)
-            else:  # pydub
-                return self._process_pydub(raw_audio_chunk)
+            # ✅ 전략별 처리 (__init__에서 고른 메서드)
+            return self._process_chunk(raw_audio_chunk)
 
         except Exception as e:
-            logger.error("오디오 변환 오류", error=str(e), strategy=self.strategy)
+            self._record_error("오디오 변환 오류", e, level="error")
             return []
 
+    def _record_error(self, message: str, error: Exception, level: str = "warning") -> None:
+        """
+        청크 단위 오류 기록
+
+        손상된 스트림은 같은 오류가 청크마다 반복되므로, 유형별 첫 발생만 traceback과 함께 로그로 남기고
+        이후는 횟수만 집계합니다. (집계는 get_stats()의 error_counts로 연결 종료 시 한 번 출력)
+        """
+        key = f"{message}:{type(error).__name__}"
+        count = self.error_counts.get(key, 0) + 1
+        self.error_counts[key] = count
+
+        if count == 1:
+            getattr(logger, level)(message, exc_info=True, strategy=self.strategy, error=str(error))
+
     def _process_numpy(self, raw_chunk: bytes) -> List[bytes]:
         """
         ✅ NumPy 직접 처리 (Raw PCM)
 
-        가장 빠른 방식 - FFmpeg 없이 순수 NumPy
+        가장 빠른 방식 - FFmpeg 없이 NumPy + soxr
         """
         # 1. bytes → numpy array
         audio_np = np.frombuffer(raw_chunk, dtype=np.int16)
 
         # 2. Stereo → Mono (채널 평균)
-        if self.input_channels == 2:
-            audio_np = audio_np.reshape(-1, 2)
-            audio_np = audio_np.mean(axis=1).astype(np.int16)
+        audio_np = _downmix_s16(audio_np, self.input_channels)
 
-        # 3. 리샘플링 (선형 보간)
-        if self.input_sample_rate != self.target_sample_rate:
-            ratio = self.target_sample_rate / self.input_sample_rate
-            num_samples = int(len(audio_np) * ratio)
+        # 3. 리샘플링 (안티에일리어싱 FIR, 예: 48k → 16k)
+        if self.pcm_resampler is not None:
+            audio_np = self.pcm_resampler.resample_chunk(audio_np)
 
-            audio_np = np.interp(
-                np.linspace(0, len(audio_np) - 1, num_samples),
-                np.arange(len(audio_np)),
-                audio_np
-            ).astype(np.int16)
-
-        # 4. 버퍼에 추가
-        pcm_bytes = audio_np.tobytes()
-        self.buffer.extend(pcm_bytes)
+        # 4. 버퍼에 추가 (bytes 변환 없이 샘플 그대로)
+        self._append_samples(audio_np)
 
         return self._extract_frames()
 
@@ -185,58 +329,108 @@ class AudioStreamConverter:
             packet = av.Packet(raw_chunk)
             frames = self.decoder.decode(packet)
 
-            # 리샘플링
             for frame in frames:
-                resampled_frames = self.resampler.resample(frame)
+                # ✅ libopus 기본 출력(s16 packed)은 FFmpeg 리샘플러를 거치지 않고
+                # Raw PCM 경로와 같은 NumPy 다운믹스 + soxr 스트림으로 바로 처리
+                if frame.format.name == "s16":
+                    self._append_decoded_s16(frame)
+                    continue
 
-                for resampled in resampled_frames:
-                    pcm_bytes = resampled.to_ndarray().tobytes()
-                    self.buffer.extend(pcm_bytes)
+                # 그 외 샘플 포맷(float/planar 등)은 PyAV 리샘플러로 변환
+                for resampled in self.resampler.resample(frame):
+                    # s16 packed mono → (1, samples) 배열
+                    self._append_samples(resampled.to_ndarray().reshape(-1))
 
             return self._extract_frames()
 
         except Exception as e:
-            logger.debug("PyAV 디코딩 실패", error=str(e))
+            self._record_error("PyAV 디코딩 실패", e, level="debug")
             return []
 
-    def _process_pydub(self, raw_chunk: bytes) -> List[bytes]:
+    def _append_decoded_s16(self, frame) -> None:
+        """디코딩된 s16 packed 프레임을 모노/목표 샘플레이트로 변환해 버퍼에 추가"""
+        samples = _downmix_s16(frame.to_ndarray().reshape(-1), len(frame.layout.channels))
+
+        # 디코더 출력 샘플레이트(Opus는 48k)를 첫 프레임에서 확인하고 soxr 스트림 생성
+        # (flush()에서 Raw PCM 경로와 같이 필터 꼬리를 배출)
+        if self.pcm_resampler is None and frame.sample_rate != self.target_sample_rate:
+            self.pcm_resampler = soxr.ResampleStream(
+                frame.sample_rate,
+                self.target_sample_rate,
+                1,
+                dtype="int16",
+                quality=constants.RESAMPLER_QUALITY
+            )
+
+        if self.pcm_resampler is not None:
+            samples = self.pcm_resampler.resample_chunk(samples)
+
+        self._append_samples(samples)
+
+    def _process_container(self, raw_chunk: bytes) -> List[bytes]:
         """
-        ✅ Pydub 처리 (폴백/호환성)
+        ✅ 컨테이너 단위 디코딩 (폴백/호환성)
 
-        느리지만 안정적
+        청크 하나가 완결된 파일이어야 함 (느리지만 안정적)
         """
         try:
-            # AudioSegment 디코딩
-            audio = AudioSegment.from_file(
-                BytesIO(raw_chunk),
-                format=self.input_format
-            )
+            self._append_samples(_decode_container(raw_chunk, self.target_sample_rate))
+            return self._extract_frames()
 
-            # 리샘플링
-            audio = audio.set_frame_rate(self.target_sample_rate)
-            audio = audio.set_channels(1)
-            audio = audio.set_sample_width(2)
+        except Exception as e:
+            self._record_error("컨테이너 디코딩 실패", e)
+            return []
 
-            # 버퍼에 추가
-            pcm_data = audio.raw_data
-            self.buffer.extend(pcm_data)
+    def _append_samples(self, samples: np.ndarray) -> None:
+        """변환된 int16 샘플을 버퍼 뒤에 기록"""
+        n = len(samples)
+        if n == 0:
+            return
 
-            return self._extract_frames()
+        if self._write + n > len(self._pcm):
+            unread = self._write - self._read
 
-        except Exception as e:
-            logger.warning("Pydub 처리 실패", error=str(e))
+            if unread + n > len(self._pcm):
+                # 남은 샘플 + 새 샘플이 들어가지 않으면 확장 (큰 청크가 한 번에 들어온 경우)
+                grown = np.empty(max(len(self._pcm) * 2, unread + n), dtype=np.int16)
+                grown[:unread] = self._pcm[self._read:self._write]
+                self._pcm = grown
+            else:
+                # 읽지 않은 샘플만 앞으로 당김
+                self._pcm[:unread] = self._pcm[self._read:self._write]
+
+            self._read = 0
+            self._write = unread
+
+        self._pcm[self._write:self._write + n] = samples
+        self._write += n
+
+    def _extract_frames(self) -> List[memoryview]:
+        """
+        버퍼에서 30ms 프레임 추출
+
+        ✅ 프레임마다 tobytes()로 bytes를 만들지 않고, 추출할 구간 전체를 한 번만 복사한 뒤
+        프레임 단위 memoryview 슬라이스로 나눔 (이후 버퍼를 재사용해도 반환한 프레임은 유지됨)
+        """
+        frame_samples = self.frame_samples
+        count = (self._write - self._read) // frame_samples
+        if count == 0:
             return []
 
-    def _extract_frames(self) -> List[bytes]:
-        """버퍼에서 30ms 프레임 추출"""
-        frames = []
+        start = self._read
+        end = start + count * frame_samples
+        block = memoryview(self._pcm[start:end].tobytes())
+        frame_bytes = self.target_frame_bytes
+        frames = [
+            block[offset:offset + frame_bytes]
+            for offset in range(0, count * frame_bytes, frame_bytes)
+        ]
 
-        while len(self.buffer) >= self.target_frame_bytes:
-            frame = bytes(self.buffer[:self.target_frame_bytes])
-            frames.append(frame)
-            del self.buffer[:self.target_frame_bytes]
-            self.total_output_frames += 1
+        self._read = end
+        if self._read == self._write:
+            self._read = self._write = 0  # 비었으면 처음부터 다시 기록
 
+        self.total_output_frames += count
         return frames
 
     def flush(self) -> Optional[bytes]:
@@ -244,16 +438,7 @@ class AudioStreamConverter:
         # 비스트리밍 포맷: 전체 변환
         if not self.is_streaming_format and len(self.raw_buffer) > 0:
             try:
-                audio = AudioSegment.from_file(
-                    BytesIO(bytes(self.raw_buffer)),
-                    format=self.input_format
-                )
-
-                audio = audio.set_frame_rate(self.target_sample_rate)
-                audio = audio.set_channels(1)
-                audio = audio.set_sample_width(2)
-
-                self.buffer.extend(audio.raw_data)
+                self._append_samples(_decode_container(bytes(self.raw_buffer), self.target_sample_rate))
                 self.raw_buffer.clear()
 
                 logger.info("비스트리밍 포맷 전체 변환 완료")
@@ -261,10 +446,15 @@ class AudioStreamConverter:
             except Exception as e:
                 logger.error("전체 변환 실패", error=str(e))
 
+        # 리샘플러 필터에 남아 있는 꼬리 샘플 배출
+        if self.pcm_resampler is not None:
+            tail = self.pcm_resampler.resample_chunk(np.empty(0, dtype=np.int16), last=True)
+            self._append_samples(tail)
+
         # 남은 버퍼 반환
-        if len(self.buffer) > 0:
-            remaining = bytes(self.buffer)
-            self.buffer.clear()
+        if self._write > self._read:
+            remaining = self._pcm[self._read:self._write].tobytes()
+            self._read = self._write = 0
             return remaining
 
         return None
@@ -274,5 +464,6 @@ class AudioStreamConverter:
             "strategy": self.strategy,
             "total_received_bytes": self.total_received_bytes,
             "total_output_frames": self.total_output_frames,
-            "buffer_bytes": len(self.buffer)
+            "buffer_bytes": (self._write - self._read) * 2,
+            "error_counts": self.error_counts
         }
\ No newline at end of file
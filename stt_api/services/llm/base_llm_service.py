@@ -44,6 +44,14 @@ class BaseLLMService(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """
+        공유 리소스(HTTP 클라이언트 등) 정리
+
+        재사용하는 연결이 없는 구현체는 오버라이드할 필요 없음
+        """
+        pass
+
 
 class LLMServiceError(Exception):
     """LLM 서비스 관련 에러"""
@@ -21,9 +21,9 @@ OLLAMA_MODEL_NAME = settings.OLLAMA_MODEL_NAME
 # API 호출 타임아웃 (초). 요약은 오래 걸릴 수 있으므로 넉넉하게 설정
 API_TIMEOUT = settings.OLLAMA_TIMEOUT
 
-# httpx 클라이언트는 재사용하는 것이 좋습니다.
-# 비동기(async) 클라이언트를 생성합니다. (워커가 비동기로 호출할 것을 대비)
-# _client = httpx.AsyncClient(timeout=API_TIMEOUT)
+# httpx 클라이언트는 재사용하는 것이 좋습니다. (OllamaService._get_client 참고)
+# 작업마다 TCP 연결/DNS 조회를 새로 하지 않도록 연결 풀을 유지합니다.
+API_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
 
 # --- 프롬프트 생성 (F-SUM-02) ---
@@ -58,13 +58,37 @@ class OllamaService(BaseLLMService):
     def __init__(self):
         self.api_url = OLLAMA_API_URL
         self.model_name = OLLAMA_MODEL_NAME
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        프로세스 공용 AsyncClient 반환
+
+        httpx 연결은 생성된 이벤트 루프에 묶이므로,
+        실행 중인 루프가 바뀐 경우에만 새 클라이언트를 만듭니다.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=API_TIMEOUT, limits=API_LIMITS)
+            self._client_loop = loop
+
+        return self._client
+
+    async def close(self) -> None:
+        """공용 클라이언트 종료"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
     async def check_connection(self) -> bool:
         try:
             logger.info("[Ollama Service] 서버 연결 확인...")
-            # ✅ [수정] 안전하게 로컬 클라이언트 사용
-            async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-                await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags")  # URL은 상황에 맞게
+            # ✅ 공용 클라이언트 사용 (연결 재사용)
+            client = self._get_client()
+            await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags")  # URL은 상황에 맞게
             logger.info("[Ollama Service] 연결 성공", model=self.model_name)
             return True
         except httpx.RequestError as e:
@@ -109,13 +133,12 @@ class OllamaService(BaseLLMService):
                     }
                 }
 
-                async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-                    response = await client.post(OLLAMA_API_URL, json=payload)
-                    response.raise_for_status()
-                    response_json = response.json()
+                response = await self._get_client().post(OLLAMA_API_URL, json=payload)
+                response.raise_for_status()
+                response_json = response.json()
 
-                    # Ollama 응답 구조: {"response": "{...}", "done": true, ...}
-                    raw_response_string = response_json.get("response", "")
+                # Ollama 응답 구조: {"response": "{...}", "done": true, ...}
+                raw_response_string = response_json.get("response", "")
 
                 # 3. 결과 파싱 및 검증
                 if not raw_response_string:
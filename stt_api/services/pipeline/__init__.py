@@ -1,7 +1,9 @@
 from .batch_pipeline import run_batch_pipeline
 from .stream_pipeline import StreamPipeline
+from .batch_queue import batch_job_queue
 
 __all__ = [
     "run_batch_pipeline",
-    "StreamPipeline"
+    "StreamPipeline",
+    "batch_job_queue"
 ]
\ No newline at end of file
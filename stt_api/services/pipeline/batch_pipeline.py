@@ -1,15 +1,42 @@
-import os
 import sys
+import asyncio
 import traceback
-from typing import Dict, Any
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, AsyncIterator, Iterator
 
 from stt_api.services.stt import whisper_service
 from stt_api.services.llm import llm_service
 from stt_api.services.storage import job_manager, JobStatus
+from stt_api.core.config import constants
 from stt_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# ✅ STT 제너레이터 전용 스레드 풀 (블로킹 추론이 이벤트 루프를 막지 않도록)
+_stt_executor = ThreadPoolExecutor(
+    max_workers=constants.BATCH_STT_WORKERS,
+    thread_name_prefix="batch-stt"
+)
+
+_SENTINEL = object()
+
+
+async def _aiter_in_executor(generator: Iterator[str]) -> AsyncIterator[str]:
+    """
+    동기 제너레이터를 스레드 풀에서 한 단계씩 진행시키는 비동기 이터레이터
+
+    STT 추론(next 호출)은 _stt_executor 스레드에서 실행되고,
+    그동안 루프는 DB/Redis/HTTP await를 계속 처리합니다.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        item = await loop.run_in_executor(_stt_executor, next, generator, _SENTINEL)
+        if item is _SENTINEL:
+            return
+        yield item
+
 
 async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any]:
     """
@@ -21,7 +48,9 @@ async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any
     - 마지막 세그먼트: TRANSCRIBED
     - 요약 완료: COMPLETED
     """
-    logger.info("[BatchPipeline] 작업 시작", job_id=job_id)
+    audio_path = Path(audio_file_path)
+
+    logger.info("[BatchPipeline] 작업 시작", job_id=job_id, file_name=audio_path.name)
 
     try:
         # ========== 1. PROCESSING 상태 ==========
@@ -52,14 +81,22 @@ async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any
         transcript_segments = []
         segment_count = 0
 
+        # ✅ 세그먼트 루프에서 반복되는 속성 조회를 미리 바인딩
+        append_segment = transcript_segments.append
+        save_segment = job_manager.save_segment
+        publish_event = job_manager.publish_event
+        processing_status = JobStatus.PROCESSING.value
+
         try:
-            # 1. 제너레이터 생성
-            stt_generator = stt.transcribe_audio_streaming(audio_file_path)
+            # 1. 제너레이터 생성 (추론은 스레드 풀에서 진행)
+            stt_generator = _aiter_in_executor(
+                stt.transcribe_audio_streaming(audio_file_path)
+            )
 
             # 2. 첫 번째 세그먼트 미리 가져오기
             try:
-                current_segment = next(stt_generator)
-            except StopIteration:
+                current_segment = await stt_generator.__anext__()
+            except StopAsyncIteration:
                 current_segment = None
 
             if current_segment:
@@ -68,34 +105,36 @@ async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any
                 while True:
                     try:
                         # 3. 다음 세그먼트가 있는지 확인 (Look-ahead)
-                        next_segment = next(stt_generator)
+                        next_segment = await stt_generator.__anext__()
 
                         # [다음 세그먼트가 있음] -> 현재 세그먼트는 "진행 중(PROCESSING)"
-                        transcript_segments.append(current_segment)
+                        append_segment(current_segment)
 
-                        await job_manager.save_segment(
+                        # ✅ 발행 전에 저장 (SSE는 구독 후 과거 세그먼트를 DB에서 재생하므로,
+                        # 저장이 늦으면 중간에 접속한 클라이언트가 그 사이 세그먼트를 놓침)
+                        await save_segment(
                             job_id=job_id,
                             segment_text=current_segment,
                             start_time=None,
                             end_time=None
                         )
 
-                        job_manager.publish_event(job_id, {
+                        publish_event(job_id, {
                             "type": "transcript_segment",
                             "text": current_segment,
                             "segment_number": segment_count,
-                            "status": JobStatus.PROCESSING.value  # ✅ 진행 중 상태
+                            "status": processing_status  # ✅ 진행 중 상태
                         })
 
                         # 포인터 이동
                         current_segment = next_segment
                         segment_count += 1
 
-                    except StopIteration:
+                    except StopAsyncIteration:
                         # [다음 세그먼트가 없음] -> 현재 세그먼트가 "마지막(TRANSCRIBED)"
-                        transcript_segments.append(current_segment)
+                        append_segment(current_segment)
 
-                        await job_manager.save_segment(
+                        await save_segment(
                             job_id=job_id,
                             segment_text=current_segment,
                             start_time=None,
@@ -103,7 +142,7 @@ async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any
                         )
 
                         # ✅ 마지막 세그먼트 반환 시 TRANSCRIBED 상태 전달
-                        job_manager.publish_event(job_id, {
+                        publish_event(job_id, {
                             "type": "transcript_segment",
                             "text": current_segment,
                             "segment_number": segment_count,
@@ -222,9 +261,9 @@ async def run_batch_pipeline(job_id: str, audio_file_path: str) -> Dict[str, Any
 
     finally:
         # ========== 8. 임시 파일 삭제 ==========
-        if os.path.exists(audio_file_path):
-            try:
-                os.remove(audio_file_path)
-                logger.info("[BatchPipeline] 임시 파일 삭제")
-            except Exception as e:
-                logger.error("[BatchPipeline] 파일 삭제 실패", error_msg=e)
\ No newline at end of file
+        try:
+            audio_path.unlink(missing_ok=True)
+            logger.info("[BatchPipeline] 임시 파일 삭제")
+        except OSError as e:
+            logger.error("[BatchPipeline] 파일 삭제 실패", error_msg=e)
+            await job_manager.log_error(job_id, "batch_cleanup", f"임시 파일 삭제 실패: {str(e)}")
\ No newline at end of file
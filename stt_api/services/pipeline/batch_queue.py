@@ -0,0 +1,88 @@
+"""
+인프로세스 배치 작업 큐
+
+단일 프로세스 배포에서 Celery(브로커 왕복 + 직렬화 + 워커 프로세스) 없이
+API 서버의 이벤트 루프 안에서 배치 파이프라인을 실행합니다.
+
+settings.BATCH_EXECUTOR == "inprocess" 일 때만 사용되며,
+수평 확장이 필요하면 기본값("celery")을 유지합니다.
+(주의: 큐에 남은 작업은 서버 종료 시 유실됩니다)
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from stt_api.services.pipeline.batch_pipeline import run_batch_pipeline
+from stt_api.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchJobQueue:
+    """asyncio.Queue + 소비자 코루틴 기반 배치 작업 큐"""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue[Tuple[str, str]]] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self, num_workers: int) -> None:
+        """소비자 코루틴 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"batch-worker-{i}")
+            for i in range(num_workers)
+        ]
+
+        logger.info("인프로세스 배치 큐 시작", workers=num_workers)
+
+    async def stop(self) -> None:
+        """소비자 코루틴 종료"""
+        if not self.is_running:
+            return
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        pending = self._queue.qsize()
+        self._workers = []
+        self._queue = None
+
+        logger.info("인프로세스 배치 큐 종료", pending_jobs=pending)
+
+    async def submit(self, job_id: str, audio_file_path: str) -> None:
+        """배치 작업 등록"""
+        if not self.is_running:
+            raise RuntimeError("인프로세스 배치 큐가 시작되지 않았습니다")
+
+        await self._queue.put((job_id, audio_file_path))
+        logger.info("배치 작업 등록", job_id=job_id, queue_size=self._queue.qsize())
+
+    async def _worker(self, worker_id: int) -> None:
+        """큐에서 작업을 꺼내 파이프라인 실행"""
+        while True:
+            job_id, audio_file_path = await self._queue.get()
+            try:
+                # run_batch_pipeline 내부에서 대부분의 에러를 처리함
+                await run_batch_pipeline(job_id, audio_file_path)
+            except Exception as e:
+                logger.error(
+                    "배치 작업 실행 실패",
+                    exc_info=True,
+                    worker_id=worker_id,
+                    job_id=job_id,
+                    error=str(e)
+                )
+            finally:
+                self._queue.task_done()
+
+
+# 전역 인스턴스
+batch_job_queue = BatchJobQueue()
@@ -1,17 +1,28 @@
 import asyncio
+import contextlib
+import logging
 import time
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Dict, Any, List
 from concurrent.futures import ThreadPoolExecutor
 
 from stt_api.services.stt import transcribe_segment_from_bytes
 from stt_api.services.llm import llm_service
 from stt_api.services.storage import job_manager, JobStatus
 from stt_api.domain.streaming_job import StreamingJob
-from stt_api.core.config import settings
+from stt_api.core.config import settings, constants
 from stt_api.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# ✅ 모든 스트림이 공유하는 STT 실행 슬롯
+# 연결마다 스레드 풀을 만들면 동시 스트림 수 × 워커 수만큼 스레드가 모델을 두고 경쟁하므로,
+# 프로세스 전체 동시 추론 수를 STREAM_MAX_WORKERS로 제한 (대기는 이벤트 루프에서 세마포어로)
+_stt_executor = ThreadPoolExecutor(
+    max_workers=constants.STREAM_MAX_WORKERS,
+    thread_name_prefix="stream-stt"
+)
+_stt_slots = asyncio.Semaphore(constants.STREAM_MAX_WORKERS)
+
 
 class StreamPipeline:
     """
@@ -20,7 +31,7 @@ class StreamPipeline:
     ✅ faster-whisper와 WhisperLiveKit 모두 지원
     """
 
-    def __init__(self, job: StreamingJob, max_workers: int = 3):
+    def __init__(self, job: StreamingJob):
         self.job = job
         self.segment_count = 0
         self.use_vad = self.job.use_vad
@@ -40,9 +51,6 @@ class StreamPipeline:
             self.stt_service = stt_service
             self.stt_engine = settings.STT_ENGINE
 
-        # ✅ STT 병렬 처리를 위한 ThreadPoolExecutor
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-
         # ✅ 처리 중인 세그먼트 큐
         self.processing_queue = asyncio.Queue()
         self.result_queue = asyncio.Queue()
@@ -55,6 +63,12 @@ class StreamPipeline:
             "pending_segments": 0
         }
 
+        # ✅ 인식된 세그먼트는 모아 두었다가 주기적으로 한 번의 INSERT로 저장
+        # (청크/세그먼트 속도와 DB 쓰기 횟수를 분리)
+        self._pending_segments: List[Dict[str, Any]] = []
+        self._segment_writer_closed = asyncio.Event()
+        self.segment_writer_task = None
+
         # ✅ 백그라운드 STT 워커 시작
         self.worker_task = None
         self.is_running = True
@@ -63,15 +77,49 @@ class StreamPipeline:
             "StreamPipeline 초기화",
             job_id=job.job_id,
             stt_engine=self.stt_engine,
-            use_vad=self.use_vad,
-            max_workers=max_workers
+            use_vad=self.use_vad
         )
 
     async def start(self):
         """파이프라인 시작"""
         self.worker_task = asyncio.create_task(self._stt_worker())
+        self.segment_writer_task = asyncio.create_task(self._segment_writer())
         logger.info("STT 워커 시작", job_id=self.job.job_id, stt_engine=self.stt_engine)
 
+    def _queue_segment(self, segment_text: str, start_time: float = None) -> None:
+        """DB에 저장할 세그먼트 추가 (다음 flush 때 일괄 저장)"""
+        self._pending_segments.append({
+            "segment_text": segment_text,
+            "start_time": start_time,  # 상대 시간(초)
+            "end_time": None  # 종료 시간은 현재 로직에서 명시적이지 않으므로 None
+        })
+
+    async def flush_segments(self) -> None:
+        """모아 둔 세그먼트를 한 번의 INSERT로 저장 (도착 순서 유지)"""
+        if not self._pending_segments:
+            return
+
+        segments, self._pending_segments = self._pending_segments, []
+        await job_manager.save_segments(self.job.job_id, segments)
+
+    async def _segment_writer(self):
+        """STREAM_SEGMENT_FLUSH_MS마다 세그먼트 flush (종료 신호를 받으면 마지막으로 한 번 더)"""
+        interval = constants.STREAM_SEGMENT_FLUSH_MS / 1000
+
+        while not self._segment_writer_closed.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._segment_writer_closed.wait(), timeout=interval)
+            await self.flush_segments()
+
+    async def stop_segment_writer(self) -> None:
+        """세그먼트 writer 종료 + 남은 세그먼트 저장 (여러 번 호출해도 안전)"""
+        self._segment_writer_closed.set()
+
+        if self.segment_writer_task is not None:
+            await self.segment_writer_task
+
+        await self.flush_segments()
+
     async def _stt_worker(self):
         """
         ✅ 백그라운드에서 STT 처리하는 워커
@@ -91,13 +139,15 @@ class StreamPipeline:
                     segment_bytes, segment_num, segment_timestamp = segment_data
 
                     # STT 처리
-                    stt_start = time.perf_counter()
-                    segment_text = await asyncio.get_event_loop().run_in_executor(
-                        self.executor,
-                        transcribe_segment_from_bytes,
-                        segment_bytes,
-                        self.job.current_prompt_context
-                    )
+                    # (세그먼트는 이전 결과를 프롬프트로 쓰므로 작업 안에서는 순서대로 처리)
+                    async with _stt_slots:
+                        stt_start = time.perf_counter()  # 슬롯 대기 시간은 제외
+                        segment_text = await asyncio.get_running_loop().run_in_executor(
+                            _stt_executor,
+                            transcribe_segment_from_bytes,
+                            segment_bytes,
+                            self.job.current_prompt_context
+                        )
                     stt_duration = (time.perf_counter() - stt_start) * 1000
 
                     self.metrics["total_stt_time"] += stt_duration
@@ -112,13 +162,14 @@ class StreamPipeline:
                         "absolute_timestamp": segment_timestamp,  # ✅ 절대 시간
                         "relative_time_sec": self.job.get_relative_time(segment_timestamp)  # ✅ 상대 시간
                     })
-                    logger.debug(
-                        "STT 워커 처리 완료",
-                        segment_number=segment_num,
-                        stt_ms=round(stt_duration, 2),
-                        text_preview=segment_text[:30] if segment_text else "",
-                        stt_engine=self.stt_engine
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "STT 워커 처리 완료",
+                            segment_number=segment_num,
+                            stt_ms=round(stt_duration, 2),
+                            text_preview=segment_text[:30] if segment_text else "",
+                            stt_engine=self.stt_engine
+                        )
 
                 except asyncio.TimeoutError:
                     # 타임아웃은 정상 (큐가 비어있을 때)
@@ -144,12 +195,38 @@ class StreamPipeline:
         오디오 청크 처리 및 실시간 결과 반환
 
         Args:
-            audio_chunk: 오디오 바이트 청크
+            audio_chunk: 오디오 바이트 청크 (bytes / bytearray / memoryview)
+                호출 중에 VAD/버퍼로 복사되고 참조는 보관하지 않으므로,
+                호출부는 반복이 끝난 뒤 같은 버퍼를 재사용해도 됨
 
         Yields:
             {"type": "transcript_segment", "text": "...", "segment_number": N}
         """
-        # ✅ VAD/버퍼로 세그먼트 감지
+        await self._detect_segment(audio_chunk)
+
+        async for result in self._drain_results():
+            yield result
+
+    async def process_audio_chunks(self, audio_chunks: List[bytes]) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        여러 프레임을 한 번에 처리 (수신 청크 하나에서 변환된 프레임 묶음용)
+
+        세그먼트 감지는 프레임마다 수행하고, 완료된 STT 결과 수거는 묶음당 한 번만 수행
+
+        Args:
+            audio_chunks: 오디오 프레임 목록 (process_audio_chunk와 같은 참조 규약)
+
+        Yields:
+            process_audio_chunk와 동일
+        """
+        for audio_chunk in audio_chunks:
+            await self._detect_segment(audio_chunk)
+
+        async for result in self._drain_results():
+            yield result
+
+    async def _detect_segment(self, audio_chunk: bytes) -> None:
+        """VAD/버퍼로 세그먼트를 감지하고, 감지되면 STT 큐에 추가"""
         processing_start = time.perf_counter()
         # ✅ process_audio_chunk가 이제 (bytes, timestamp) 튜플 반환
         result = self.job.process_audio_chunk(audio_chunk)
@@ -181,6 +258,8 @@ class StreamPipeline:
                 detection_method="VAD" if self.use_vad else "Buffer"
             )
 
+    async def _drain_results(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """완료된 STT 결과를 결과 큐에서 꺼내 클라이언트 전송용 메시지로 반환"""
         # ✅ 결과 큐에서 완료된 결과 가져오기 (non-blocking)
         while not self.result_queue.empty():
             try:
@@ -199,15 +278,9 @@ class StreamPipeline:
                     segment_text = result["text"]
                     if segment_text:
                         # Job의 문맥 업데이트
-                        self.job.current_prompt_context += " " + segment_text
-                        self.job.full_transcript.append(segment_text)
-
-                        await job_manager.save_segment(
-                            job_id=self.job.job_id,
-                            segment_text=segment_text,
-                            start_time=result.get("relative_time_sec"),  # 상대 시간(초) 저장
-                            end_time=None  # 종료 시간은 현재 로직에서 명시적이지 않으므로 None
-                        )
+                        self.job.append_transcript(segment_text)
+
+                        self._queue_segment(segment_text, result.get("relative_time_sec"))
 
                         # ✅ 타임스탬프 정보 포함하여 반환
                         yield {
@@ -282,17 +355,11 @@ class StreamPipeline:
                     )
 
                     if "error" not in result and result.get("text"):
-                        text = result["tesx"]
-                        self.job.current_prompt_context += " " + text
-                        self.job.full_transcript.append(text)
+                        text = result["text"]
+                        self.job.append_transcript(text)
 
                         # ✅ [추가됨] 종료 후 처리된 세그먼트도 DB에 저장
-                        await job_manager.save_segment(
-                            job_id=self.job.job_id,
-                            segment_text=text,
-                            start_time=result.get("relative_time_sec"),
-                            end_time=None
-                        )
+                        self._queue_segment(text, result.get("relative_time_sec"))
 
                         logger.info(
                             "STT 결과 수신",
@@ -324,8 +391,8 @@ class StreamPipeline:
                 except asyncio.TimeoutError:
                     logger.warning("워커 종료 타임아웃, 강제 종료")
 
-            # ThreadPoolExecutor 종료
-            self.executor.shutdown(wait=False)
+            # ✅ 남은 세그먼트 저장 (TRANSCRIBED 기록 전에 세그먼트가 모두 DB에 있도록)
+            await self.stop_segment_writer()
 
             final_transcript = self.job.get_full_transcript()
 
@@ -417,6 +484,7 @@ class StreamPipeline:
                 job_id=self.job.job_id,
                 error=str(e)
             )
+            await self.stop_segment_writer()
             await job_manager.log_error(self.job.job_id, "stream_finalize", error_msg)
             return {
                 "type": "error",
@@ -4,6 +4,8 @@ from .cache_service import (  # ✅ 추가
     create_job as cache_create_job,
     get_job as cache_get_job,
     update_job as cache_update_job,
+    set_job as cache_set_job,
+    invalidate_job as cache_invalidate_job,
     publish_message,
     subscribe_to_messages
 )
@@ -23,6 +25,8 @@ __all__ = [
     "cache_create_job",
     "cache_get_job",
     "cache_update_job",
+    "cache_set_job",
+    "cache_invalidate_job",
     "publish_message",
     "subscribe_to_messages",
 ]
\ No newline at end of file
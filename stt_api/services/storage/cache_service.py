@@ -12,7 +12,7 @@ import redis.asyncio as aioredis
 import time
 from typing import Dict, Any, Optional
 
-from stt_api.core.config import settings  # ✅ 설정 통합
+from stt_api.core.config import settings, constants  # ✅ 설정 통합
 from stt_api.core.logging_config import get_logger
 from stt_api.core.exceptions import (
     StorageException,
@@ -69,6 +69,26 @@ if not redis_client:
     get_redis_client()
 
 JOB_KEY_PREFIX = "job:med:"
+MEMBER_KEY_PREFIX = "room:member:"
+
+# 자기 job_id로 선점한 경우에만 삭제 (다른 작업이 다시 선점한 키는 건드리지 않음)
+_RELEASE_MEMBER_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 이전 작업(ARGV[1])이 아직 잡고 있거나 키가 사라진 경우에만 새 작업(ARGV[2])으로 교체
+# (동시에 재접속한 다른 작업이 먼저 넘겨받았으면 그 job_id 반환)
+_TAKEOVER_MEMBER_SCRIPT = """
+local current = redis.call('get', KEYS[1])
+if current == false or current == ARGV[1] then
+    redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return false
+end
+return current
+"""
 
 
 # --- CRUD 함수 ---
@@ -98,7 +118,7 @@ def create_job(job_id: str, metadata: Dict[str, Any] = None) -> bool:
 
 
 def get_job(job_id: str) -> Optional[Dict[str, Any]]:
-    """Redis에서 작업 조회"""
+    """Redis에서 작업 조회 (캐시 미스면 None, 로그 없음)"""
     if not redis_client:
         # ✅ CustomException 사용
         raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
@@ -109,7 +129,7 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         data_str = redis_client.get(key)
         if data_str:
             return json.loads(data_str)
-        raise JobNotFoundException(job_id=job_id)
+        return None
     except Exception as e:
         logger.error("작업 조회 실패", job_id=job_id, error=str(e))
         raise StorageException(
@@ -146,6 +166,115 @@ def update_job(job_id: str, updates: Dict[str, Any]) -> bool:
         )
 
 
+def set_job(job_id: str, data: Dict[str, Any], ttl: int, only_if_absent: bool = False) -> bool:
+    """
+    Redis에 작업 전체 데이터 저장 (단일 SET EX)
+
+    Args:
+        only_if_absent: True면 키가 없을 때만 저장 (SET NX, 조회 경로의 캐시 채우기용)
+            상태 변경 시 기록한 최신 값을 변경 전에 읽은 조회 결과가 덮어쓰지 않도록 함
+
+    Returns:
+        저장 여부 (only_if_absent인데 이미 키가 있으면 False)
+    """
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    key = f"{JOB_KEY_PREFIX}{job_id}"
+
+    try:
+        return bool(redis_client.set(key, json.dumps(data), ex=ttl, nx=only_if_absent))
+    except Exception as e:
+        logger.error("작업 캐시 저장 실패", job_id=job_id, error=str(e))
+        raise StorageException(
+            message="작업 캐시 저장 실패",
+            details={"job_id": job_id, "error": str(e)}
+        )
+
+
+def invalidate_job(job_id: str) -> None:
+    """Redis 작업 캐시 무효화 (단일 DEL, 다음 조회 시 DB에서 다시 채움)"""
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    redis_client.delete(f"{JOB_KEY_PREFIX}{job_id}")
+
+
+# --- 화상 회의 참가자 선점 ---
+
+def claim_member(room_id: str, member_id: str, job_id: str, ttl: int) -> Optional[str]:
+    """
+    방의 참가자 슬롯을 job_id로 선점 (SET NX EX 단일 왕복)
+
+    Returns:
+        선점 성공 시 None, 이미 다른 작업이 점유 중이면 그 job_id
+    """
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    key = f"{MEMBER_KEY_PREFIX}{room_id}:{member_id}"
+
+    if redis_client.set(key, job_id, nx=True, ex=ttl):
+        return None
+
+    existing_job_id = redis_client.get(key)
+    if existing_job_id is None:
+        # 조회 사이에 만료된 경우 한 번 더 시도
+        if redis_client.set(key, job_id, nx=True, ex=ttl):
+            return None
+        existing_job_id = redis_client.get(key)
+
+    return existing_job_id
+
+
+def takeover_member(
+        room_id: str,
+        member_id: str,
+        job_id: str,
+        previous_job_id: str,
+        ttl: int
+) -> Optional[str]:
+    """
+    끝난 이전 작업이 남긴 참가자 슬롯을 job_id로 넘겨받음 (compare-and-set)
+
+    Returns:
+        넘겨받으면 None, 그 사이 다른 작업이 먼저 넘겨받았으면 그 job_id
+    """
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    return redis_client.eval(
+        _TAKEOVER_MEMBER_SCRIPT, 1, f"{MEMBER_KEY_PREFIX}{room_id}:{member_id}",
+        previous_job_id, job_id, ttl
+    )
+
+
+def get_member_claim_age(room_id: str, member_id: str, ttl: int) -> Optional[float]:
+    """
+    참가자 슬롯 선점 후 지난 시간 (초, 남은 TTL로 계산)
+
+    Returns:
+        경과 시간, 키가 없거나 만료가 없으면 None
+    """
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    remaining = redis_client.ttl(f"{MEMBER_KEY_PREFIX}{room_id}:{member_id}")
+    if remaining is None or remaining < 0:
+        return None
+    return ttl - remaining
+
+
+def release_member(room_id: str, member_id: str, job_id: str) -> None:
+    """job_id가 선점한 참가자 슬롯 해제"""
+    if not redis_client:
+        raise RedisConnectionError(details="Redis 클라이언트가 초기화되지 않음")
+
+    redis_client.eval(
+        _RELEASE_MEMBER_SCRIPT, 1, f"{MEMBER_KEY_PREFIX}{room_id}:{member_id}", job_id
+    )
+
+
 # --- Pub/Sub 함수 ---
 
 def publish_message(job_id: str, message_data: Dict[str, Any]):
@@ -160,7 +289,12 @@ def publish_message(job_id: str, message_data: Dict[str, Any]):
 
 
 async def subscribe_to_messages(job_id: str):
-    """Redis 채널 구독 (비동기)"""
+    """
+    Redis 채널 구독 (비동기)
+
+    첫 번째로 None을 yield하며, 이는 서버가 SUBSCRIBE를 확인했다는 신호입니다.
+    그 이후 발행된 메시지는 유실되지 않으므로, 호출 측은 첫 값을 받은 뒤 과거 데이터를 조회하면 됩니다.
+    """
     async_redis = aioredis.from_url(
         settings.REDIS_URL,  # ✅ config 사용
         encoding="utf-8",
@@ -172,7 +306,16 @@ async def subscribe_to_messages(job_id: str):
 
     try:
         await pubsub.subscribe(channel)
+
+        # ✅ 구독 확인 응답을 받을 때까지 대기 (명령 전송만으로는 서버 등록이 보장되지 않음)
+        async with asyncio.timeout(constants.REDIS_SUBSCRIBE_TIMEOUT_SEC):
+            while True:
+                ack = await pubsub.get_message(timeout=constants.REDIS_SUBSCRIBE_TIMEOUT_SEC)
+                if ack and ack['type'] == 'subscribe':
+                    break
+
         logger.info("채널 구독 시작", channel=channel)
+        yield None
 
         while True:
             message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=30.0)
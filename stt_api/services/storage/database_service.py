@@ -7,7 +7,7 @@ SQLAlchemy를 사용한 MariaDB 연동
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import json
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, insert, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from stt_api.core.database import get_transaction
@@ -209,19 +209,65 @@ class DatabaseService:
             )
             return False
 
+    async def insert_stt_segments(self, job_id: str, segments: List[Dict[str, Any]]) -> bool:
+        """
+        T_STT_SEGMENT 테이블에 여러 세그먼트를 한 번의 INSERT로 삽입
+
+        Args:
+            job_id: 작업 ID
+            segments: {"segment_text", "start_time", "end_time"} 딕셔너리 목록 (순서대로 저장)
+        """
+        if not segments:
+            return True
+
+        rows = [
+            {
+                "job_id": job_id,
+                "segment_text": segment["segment_text"],
+                "start_time": segment.get("start_time"),
+                "end_time": segment.get("end_time"),
+                "reg_id": "system"  # TODO: 실제 사용자 ID로 변경
+            }
+            for segment in segments
+        ]
+
+        try:
+            async with get_transaction() as session:
+                await session.execute(insert(STTSegment), rows)
+
+            logger.debug(
+                "T_STT_SEGMENT 일괄 삽입",
+                job_id=job_id,
+                count=len(rows)
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "T_STT_SEGMENT 일괄 삽입 실패",
+                exc_info=True,
+                job_id=job_id,
+                count=len(rows),
+                error=str(e)
+            )
+            return False
+
     async def get_stt_segments(self, job_id: str) -> List[Dict[str, Any]]:
         """
         특정 job의 모든 세그먼트 조회
         """
         try:
             async with get_transaction() as session:
+                # ✅ ORM 객체 생성 없이 행을 그대로 dict로 (컬럼명 = to_dict() 키)
+                # 일괄 INSERT된 행은 start_time이 없으므로 삽입 순서(segment_seq)로 정렬 보조
+                table = STTSegment.__table__
                 stmt = (
-                    select(STTSegment)
-                    .where(STTSegment.job_id == job_id)
-                    .order_by(STTSegment.start_time)
+                    select(table)
+                    .where(table.c.job_id == job_id)
+                    .order_by(table.c.start_time, table.c.segment_seq)
                 )
                 result = await session.execute(stmt)
-                segments = result.scalars().all()
+                segments = [dict(row) for row in result.mappings()]
 
             logger.debug(
                 "T_STT_SEGMENT 조회",
@@ -229,7 +275,7 @@ class DatabaseService:
                 count=len(segments)
             )
 
-            return [seg.to_dict() for seg in segments]
+            return segments
 
         except Exception as e:
             logger.error(
@@ -285,13 +331,15 @@ class DatabaseService:
         """
         try:
             async with get_transaction() as session:
+                # ✅ ORM 객체 생성 없이 행을 그대로 dict로 (datetime은 응답 직렬화 시 ISO 형식으로 변환됨)
+                table = STTErrorLog.__table__
                 stmt = (
-                    select(STTErrorLog)
-                    .where(STTErrorLog.job_id == job_id)
-                    .order_by(STTErrorLog.reg_dttm.desc())
+                    select(table)
+                    .where(table.c.job_id == job_id)
+                    .order_by(table.c.reg_dttm.desc())
                 )
                 result = await session.execute(stmt)
-                errors = result.scalars().all()
+                errors = [dict(row) for row in result.mappings()]
 
             logger.debug(
                 "T_STT_ERROR_LOG 조회",
@@ -299,7 +347,7 @@ class DatabaseService:
                 count=len(errors)
             )
 
-            return [err.to_dict() for err in errors]
+            return errors
 
         except Exception as e:
             logger.error(
@@ -366,8 +414,15 @@ class DatabaseService:
         """
         try:
             async with get_transaction() as session:
+                # ✅ 통합 요약에 필요한 컬럼만 조회 (ORM 객체/나머지 컬럼 로드 생략)
                 stmt = (
-                    select(STTJob)
+                    select(
+                        STTJob.job_id,
+                        STTJob.member_id,
+                        STTJob.original_transcript,
+                        STTJob.structured_summary,
+                        STTJob.reg_dttm
+                    )
                     .where(STTJob.room_id == room_id)
                     .where(STTJob.status.in_(["COMPLETED", "TRANSCRIBED"]))
                     .where(STTJob.original_transcript.isnot(None))
@@ -375,7 +430,7 @@ class DatabaseService:
                 )
 
                 result = await session.execute(stmt)
-                jobs = result.scalars().all()
+                jobs = result.all()
 
             transcripts = []
             for job in jobs:
@@ -3,6 +3,7 @@ from typing import Dict, Any, Optional, List
 import asyncio
 from .database_service import db_service
 from . import cache_service
+from stt_api.core.config import constants
 from stt_api.core.logging_config import get_logger
 from stt_api.core.exceptions import (
     StorageException,
@@ -131,8 +132,12 @@ class JobManager:
             **extra_data
     ) -> bool:
         """
-        작업 상태 업데이트 (DB + Redis 동기화)
-        ✅ async 함수로 변경
+        작업 상태 업데이트 (DB 기록 후 최신 행으로 Redis 캐시 덮어쓰기)
+
+        DB가 유일한 기준 저장소이며, 캐시에는 갱신 직후 DB에서 다시 읽은 행을 그대로 저장합니다.
+        (조회 경로는 키가 없을 때만 채우므로, 변경 전에 읽은 오래된 행이 이 값을 덮어쓰지 못함)
+        status는 DB 값(대문자, 예: "COMPLETED") 그대로 캐시/응답에 노출됩니다.
+        extra_data는 로그 컨텍스트로만 남습니다.
         """
         try:
             # ✅ DB 업데이트 (await 사용)
@@ -144,25 +149,18 @@ class JobManager:
                 error_message=error_message
             )
 
-            # Redis 캐시 업데이트
-            cache_data = {
-                "status": status.value.lower(),
-                **extra_data
-            }
-
-            if transcript:
-                cache_data["original_transcript"] = transcript
-            if summary:
-                cache_data["structured_summary"] = summary
-            if error_message:
-                cache_data["error_message"] = error_message
-
+            # Redis 캐시 갱신 (write-through, 실패 시 무효화해 다음 조회에서 DB로 다시 채움)
             try:
-                self.cache.update_job(job_id, cache_data)
+                fresh_job = await self.db.get_stt_job(job_id)
+                self.cache.set_job(job_id, fresh_job, constants.JOB_CACHE_TTL_SEC)
             except Exception as cache_error:
-                logger.warning("Redis 캐시 업데이트 실패", job_id=job_id)
+                logger.warning("Redis 캐시 갱신 실패", job_id=job_id, error=str(cache_error))
+                try:
+                    self.cache.invalidate_job(job_id)
+                except Exception:
+                    pass
 
-            logger.info("상태 업데이트", job_id=job_id, job_status=status.value)
+            logger.info("상태 업데이트", job_id=job_id, job_status=status.value, **extra_data)
             return True
 
         except StorageException:
@@ -185,7 +183,11 @@ class JobManager:
             logger.error("이벤트 발행 실패", message=str(e))
 
     async def subscribe_events(self, job_id: str):
-        """작업 이벤트 구독 (Redis Pub/Sub)"""
+        """
+        작업 이벤트 구독 (Redis Pub/Sub)
+
+        첫 값은 구독 확인 신호(None), 이후 이벤트 dict (cache_service.subscribe_to_messages 참고)
+        """
         try:
             async for message in self.cache.subscribe_to_messages(job_id):
                 yield message
@@ -214,6 +216,14 @@ class JobManager:
             logger.error("세그먼트 저장 실패", error=str(e))
             return False
 
+    async def save_segments(self, job_id: str, segments: List[Dict[str, Any]]) -> bool:
+        """STT 세그먼트 여러 개를 한 번에 저장 (DB)"""
+        try:
+            return await self.db.insert_stt_segments(job_id, segments)
+        except Exception as e:
+            logger.error("세그먼트 일괄 저장 실패", error=str(e))
+            return False
+
     async def get_segments(self, job_id: str):
         """작업의 모든 세그먼트 조회 - async 변경"""
         try:
@@ -246,16 +256,9 @@ class JobManager:
     def _update_cache_from_db(self, job_id: str, db_data: Dict[str, Any]) -> None:
         """DB 데이터를 Redis 캐시에 동기화 (내부용)"""
         try:
-            cache_data = {
-                "status": db_data.get("status", "").lower(),
-                "original_transcript": db_data.get("original_transcript"),
-                "structured_summary": db_data.get("structured_summary"),
-                "error_message": db_data.get("error_message"),
-                "metadata": db_data.get("metadata", {})
-            }
-
-            self.cache.update_job(job_id, cache_data)
-            logger.info("캐시 동기화 완료", job_id=job_id)
+            # ✅ 키가 없을 때만 채움 (그 사이 update_status가 기록한 최신 값을 덮어쓰지 않음)
+            if self.cache.set_job(job_id, db_data, constants.JOB_CACHE_TTL_SEC, only_if_absent=True):
+                logger.info("캐시 동기화 완료", job_id=job_id)
 
         except Exception as e:
             logger.error("캐시 동기화 실패", error=str(e))
@@ -283,6 +286,114 @@ class JobManager:
             )
             return None
 
+    async def claim_member(
+            self,
+            room_id: str,
+            member_id: str,
+            job_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        참가자 슬롯을 job_id로 선점 (중복 접속 방지)
+
+        일반적인 경우 Redis SET NX 한 번으로 끝나고, 이미 점유된 경우에만
+        기존 작업 상태를 DB에서 확인하여 끝난 작업이면 슬롯을 넘겨받음.
+        Redis 장애 시에는 DB 조회(check_member_exists)로 폴백.
+
+        Returns:
+            진행 중인 기존 작업 정보 (중복 접속) 또는 None (선점 성공)
+        """
+        ttl = constants.ROOM_MEMBER_CLAIM_TTL_SEC
+
+        try:
+            existing_job_id = self.cache.claim_member(room_id, member_id, job_id, ttl)
+        except Exception as e:
+            logger.warning(
+                "참가자 선점 실패, DB 조회로 폴백",
+                room_id=room_id,
+                member_id=member_id,
+                error=str(e)
+            )
+            existing_job = await self.check_member_exists(room_id, member_id)
+            if existing_job and existing_job.get("status", "").upper() in ("PENDING", "PROCESSING"):
+                return existing_job
+            return None
+
+        if existing_job_id is None:
+            return None
+
+        existing_job = await self._get_job_or_none(existing_job_id)
+
+        if existing_job is None:
+            # 선점 직후 DB 작업 생성 전이면 진행 중으로 취급,
+            # 유예 시간이 지나도 행이 없으면 생성 전에 죽은 선점으로 보고 넘겨받음
+            try:
+                claim_age = self.cache.get_member_claim_age(room_id, member_id, ttl)
+            except Exception:
+                claim_age = None
+
+            if claim_age is not None and claim_age < constants.ROOM_MEMBER_CLAIM_GRACE_SEC:
+                return {"job_id": existing_job_id, "status": JobStatus.PENDING.value}
+
+            existing_status = "MISSING"
+        else:
+            # 키가 남아 있어도 이전 작업이 끝났으면 재접속 허용
+            existing_status = existing_job.get("status", "").upper()
+
+            if existing_status in ("PENDING", "PROCESSING"):
+                return {**existing_job, "job_id": existing_job_id, "status": existing_status}
+
+        logger.info(
+            "참가자 재접속 (이전 작업 완료 또는 생성되지 않음)",
+            room_id=room_id,
+            member_id=member_id,
+            previous_job_id=existing_job_id,
+            previous_status=existing_status
+        )
+
+        try:
+            holder_job_id = self.cache.takeover_member(room_id, member_id, job_id, existing_job_id, ttl)
+        except Exception as e:
+            logger.warning("참가자 슬롯 갱신 실패", room_id=room_id, member_id=member_id, error=str(e))
+            return None
+
+        if holder_job_id is not None:
+            # 동시에 재접속한 다른 작업이 먼저 슬롯을 넘겨받음 → 중복 접속으로 처리
+            logger.warning(
+                "참가자 슬롯 선점 충돌 (다른 재접속이 먼저 넘겨받음)",
+                room_id=room_id,
+                member_id=member_id,
+                holder_job_id=holder_job_id
+            )
+            # 방금 넘겨받은 작업은 아직 DB 행이 없을 수 있음
+            holder_job = await self._get_job_or_none(holder_job_id) or {}
+            return {
+                **holder_job,
+                "job_id": holder_job_id,
+                "status": holder_job.get("status", JobStatus.PENDING.value).upper()
+            }
+
+        return None
+
+    async def _get_job_or_none(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없으면 None, 참가자 슬롯 점유 작업 확인용)"""
+        try:
+            return await self.get_job(job_id)
+        except JobNotFoundException:
+            return None
+
+    async def release_member(self, room_id: str, member_id: str, job_id: str) -> None:
+        """job_id가 선점한 참가자 슬롯 해제 (실패해도 TTL로 만료됨)"""
+        try:
+            self.cache.release_member(room_id, member_id, job_id)
+        except Exception as e:
+            logger.warning(
+                "참가자 슬롯 해제 실패",
+                room_id=room_id,
+                member_id=member_id,
+                job_id=job_id,
+                error=str(e)
+            )
+
     async def get_or_create_room(
             self,
             room_id: str
@@ -18,10 +18,26 @@ from .vad_processor import VADProcessor
 # ✅ 직접 엔진 import도 가능 (테스트/디버깅용)
 from . import whisper_service
 
-try:
-    from . import whisperlive_service
-except ImportError:
-    whisperlive_service = None  # whisperlivekit 미설치 시
+
+def __getattr__(name):
+    """
+    whisperlive_service 지연 import
+
+    whisperlivekit(torch 포함)은 무거우므로 faster-whisper 엔진만 쓰는 워커에서는
+    처음 접근할 때까지 로드하지 않음
+    """
+    if name == "whisperlive_service":
+        import importlib
+
+        try:
+            module = importlib.import_module(".whisperlive_service", __name__)
+        except ImportError:
+            module = None  # whisperlivekit 미설치 시
+
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # 기본 인터페이스 (자동 엔진 선택)
@@ -133,7 +133,6 @@
 
 import torch
 import numpy as np
-from collections import deque
 from stt_api.core.config import constants, settings
 from stt_api.core.logging_config import get_logger
 from stt_api.core.exceptions import AudioFormatError
@@ -151,6 +150,7 @@ class VADProcessor:
         self.sample_rate = constants.VAD_SAMPLE_RATE
         self.frame_duration_ms = constants.VAD_FRAME_DURATION_MS
         self.threshold = constants.VAD_THRESHOLD
+        self.noise_floor = constants.VAD_NOISE_FLOOR
 
         # 32ms @ 16kHz = 512 samples * 2 bytes = 1024 bytes
         self.frame_bytes = int(self.sample_rate * (self.frame_duration_ms / 1000.0) * 2)
@@ -176,7 +176,15 @@ class VADProcessor:
         self.min_speech_frames = constants.VAD_MIN_SPEECH_FRAMES
         self.max_silence_frames = constants.VAD_MAX_SILENCE_FRAMES
 
-        self.speech_buffer = deque()
+        # ✅ 최대 세그먼트 길이: 쉬지 않고 말해도 이 길이에서 세그먼트를 내보냄
+        self.max_segment_ms = constants.VAD_MAX_SEGMENT_MS
+        self.max_segment_frames = int(self.max_segment_ms / self.frame_duration_ms)
+
+        # ✅ 발화 버퍼: 프레임마다 bytes 객체를 쌓지 않도록 고정 크기 bytearray를 재사용
+        # (최대 세그먼트 길이만큼만 할당 → 스트림당 메모리 상한 고정)
+        self._buffer = bytearray(self.frame_bytes * self.max_segment_frames)
+        self._write = 0  # 버퍼에 기록된 바이트 수
+
         self.in_speech = False
         self.silence_frames = 0
         self.speech_frames = 0
@@ -194,53 +202,81 @@ class VADProcessor:
             return None
 
         # 2. Int16 Bytes -> Float32 Tensor 변환 (Silero 입력 포맷)
-        # (1) bytes -> numpy int16
+        # (1) bytes -> numpy int16 (zero-copy)
         audio_int16 = np.frombuffer(audio_chunk, np.int16)
 
-        # (2) int16 -> float32 (정규화: -1.0 ~ 1.0)
-        audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        # ✅ (1-1) 에너지 사전 게이트: 피크가 노이즈 플로어 미만이면 모델 추론 생략
+        # (명백한 무음/마이크 잡음 구간에서 Silero 호출 비용을 없앰)
+        peak = max(int(audio_int16.max()), -int(audio_int16.min()))
 
-        # (3) numpy -> torch tensor
-        audio_tensor = torch.from_numpy(audio_float32)
+        if peak < self.noise_floor:
+            is_speech = False
+        else:
+            # (2) int16 -> float32 (정규화: -1.0 ~ 1.0)
+            audio_float32 = audio_int16.astype(np.float32) / 32768.0
 
-        # 3. 모델 추론 (음성일 확률 계산)
-        # model(input, sample_rate) -> probability (0.0 ~ 1.0)
-        with torch.no_grad():
-            speech_prob = self.model(audio_tensor, self.sample_rate).item()
+            # (3) numpy -> torch tensor
+            audio_tensor = torch.from_numpy(audio_float32)
 
-        # 4. 확률 기반 음성 판별
-        is_speech = speech_prob >= self.threshold
+            # 3. 모델 추론 (음성일 확률 계산)
+            # model(input, sample_rate) -> probability (0.0 ~ 1.0)
+            with torch.no_grad():
+                speech_prob = self.model(audio_tensor, self.sample_rate).item()
+
+            # 4. 확률 기반 음성 판별
+            is_speech = speech_prob >= self.threshold
 
         # --- 기존 버퍼링 로직 유지 (Silero에 맞게 적용) ---
         if is_speech:
-            self.speech_buffer.append(audio_chunk)
+            self._append(audio_chunk)
             self.speech_frames += 1
             self.silence_frames = 0
 
             if self.speech_frames >= self.min_speech_frames:
                 self.in_speech = True
+
+            # ✅ 빠른 종료: 최대 길이에 도달하면 침묵을 기다리지 않고 세그먼트 반환
+            if self._write >= len(self._buffer):
+                return self._close_segment()
         else:
             # 침묵 구간
             if self.in_speech:
                 self.silence_frames += 1
                 if self.silence_frames < self.max_silence_frames:
                     # 짧은 침묵은 말 끊김 방지를 위해 버퍼에 포함
-                    self.speech_buffer.append(audio_chunk)
+                    self._append(audio_chunk)
+
+                    if self._write >= len(self._buffer):
+                        return self._close_segment()
                 else:
                     # 침묵이 길어지면 문장 종료로 판단 -> 세그먼트 반환
-                    segment = b''.join(list(self.speech_buffer))
-                    self._reset()
-                    return segment
+                    return self._close_segment()
             else:
-                # 말하기 시작 전의 침묵은 버림 (메모리 절약)
-                self.speech_buffer.clear()
+                # 말하기 시작 전의 침묵은 버림 (쓰기 위치만 되돌림)
+                self._write = 0
                 self.speech_frames = 0
 
         return None
 
+    def _append(self, audio_chunk: bytes):
+        """프레임을 발화 버퍼 끝에 복사 (호출부에서 가득 차면 세그먼트를 닫으므로 넘치지 않음)"""
+        end = self._write + self.frame_bytes
+        self._buffer[self._write:end] = audio_chunk
+        self._write = end
+
+    def _segment_bytes(self) -> bytes:
+        """현재까지 버퍼링된 발화를 bytes로 복사해 반환"""
+        return bytes(memoryview(self._buffer)[:self._write])
+
+    def _close_segment(self) -> bytes:
+        """버퍼링된 발화를 세그먼트로 반환하고 상태 초기화"""
+        segment = self._segment_bytes()
+        self._reset()
+        return segment
+
     def _reset(self):
         """세그먼트 반환 후 상태 초기화"""
-        self.speech_buffer.clear()
+        self._write = 0
         self.in_speech = False
         self.silence_frames = 0
         self.speech_frames = 0
@@ -250,8 +286,6 @@ class VADProcessor:
 
     def flush(self):
         """연결 종료 시 남은 버퍼 반환"""
-        if len(self.speech_buffer) > 0 and self.speech_frames >= self.min_speech_frames:
-            segment = b''.join(list(self.speech_buffer))
-            self._reset()
-            return segment
+        if self._write > 0 and self.speech_frames >= self.min_speech_frames:
+            return self._close_segment()
         return None
\ No newline at end of file
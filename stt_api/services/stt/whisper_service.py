@@ -1,4 +1,4 @@
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, BatchedInferencePipeline
 from typing import Optional, Generator
 import numpy as np
 import time
@@ -17,6 +17,12 @@ logger = get_logger(__name__)
 # 전역 모델 변수
 _model: Optional[WhisperModel] = None
 
+# ✅ 파일 변환용 배치 파이프라인 (같은 모델 가중치 공유)
+_batched_model: Optional[BatchedInferencePipeline] = None
+
+# int16 PCM → [-1, 1) float32 변환 계수
+_PCM_SCALE = np.float32(1.0 / 32768.0)
+
 
 # ==================== 모델 로드 ====================
 
@@ -27,7 +33,7 @@ def load_stt_model() -> None:
     Raises:
         STTProcessingError: 모델 로드 실패 시
     """
-    global _model
+    global _model, _batched_model
 
     if _model is not None:
         logger.info("STT 모델이 이미 로드되었습니다")
@@ -50,6 +56,9 @@ def load_stt_model() -> None:
             num_workers=1  # 워커 수
         )
 
+        if settings.STT_BATCH_SIZE > 1:
+            _batched_model = BatchedInferencePipeline(model=_model)
+
         logger.info(
             "STT 모델 로드 완료",
             model_size=settings.STT_MODEL_SIZE,
@@ -94,6 +103,32 @@ def _ensure_model_loaded() -> None:
 
 # ==================== STT 처리 함수들 ====================
 
+def _transcribe_file(file_path: str):
+    """
+    파일 전체 변환 (segments 제너레이터, info 반환)
+
+    배치 파이프라인이 있으면 VAD로 나눈 구간을 STT_BATCH_SIZE개씩 묶어 한 번에 디코딩하고
+    (GPU에서 순차 디코딩 대비 수 배 빠름), 없으면 기존 순차 디코딩을 사용합니다.
+    """
+    vad_parameters = {"min_silence_duration_ms": 500}
+
+    if _batched_model is not None:
+        return _batched_model.transcribe(
+            file_path,
+            language=settings.STT_LANGUAGE,
+            batch_size=settings.STT_BATCH_SIZE,
+            vad_filter=True,
+            vad_parameters=vad_parameters
+        )
+
+    return _model.transcribe(
+        file_path,
+        language=settings.STT_LANGUAGE,
+        vad_filter=True,
+        vad_parameters=vad_parameters
+    )
+
+
 def transcribe_audio(file_path: str) -> str:
     """
     오디오 파일을 텍스트로 변환 (전체 파일)
@@ -114,12 +149,7 @@ def transcribe_audio(file_path: str) -> str:
 
     try:
         # VAD 필터 적용하여 음성 구간만 처리
-        segments, info = _model.transcribe(
-            file_path,
-            language=settings.STT_LANGUAGE,
-            vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 500}
-        )
+        segments, info = _transcribe_file(file_path)
 
         # 세그먼트 수집
         transcript_parts = []
@@ -177,12 +207,7 @@ def transcribe_audio_streaming(file_path: str) -> Generator[str, None, None]:
     logger.info("STT 스트리밍 작업 시작", file_path=file_path)
 
     try:
-        segments, info = _model.transcribe(
-            file_path,
-            language=settings.STT_LANGUAGE,
-            vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 500}
-        )
+        segments, info = _transcribe_file(file_path)
 
         segment_count = 0
 
@@ -254,12 +279,12 @@ def transcribe_segment_from_bytes(
     )
 
     try:
-        # 1. NumPy 변환
+        # 1. NumPy 변환 (✅ astype + 나눗셈 2회 대신 float32로 곱하며 한 번에 변환)
         audio_np = np.frombuffer(audio_bytes, dtype=np.int16)
-        audio_float32 = audio_np.astype(np.float32) / 32768.0
+        audio_float32 = np.multiply(audio_np, _PCM_SCALE, dtype=np.float32)
 
-        # ✅ 1-1. 소음 감지 (RMS 에너지 체크)
-        rms_energy = np.sqrt(np.mean(audio_float32 ** 2))
+        # ✅ 1-1. 소음 감지 (RMS 에너지 체크, 제곱 임시 배열 없이 내적으로 계산)
+        rms_energy = np.sqrt(np.dot(audio_float32, audio_float32) / max(audio_float32.size, 1))
 
         # RMS가 너무 낮으면 소음으로 간주 (조정 가능)
         MIN_RMS_THRESHOLD = 0.01
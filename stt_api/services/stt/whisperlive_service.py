@@ -45,7 +45,8 @@ def load_stt_model() -> None:
             language=settings.STT_LANGUAGE,
             diarization=settings.WHISPERLIVE_USE_DIARIZATION,
             backend="openai_whisper",
-            device=settings.STT_DEVICE_TYPE
+            device=settings.STT_DEVICE_TYPE,
+            compute_type=settings.STT_COMPUTE_TYPE
         )
 
         _audio_processor = AudioProcessor(transcription_engine=_engine)
@@ -1,12 +1,14 @@
-import asyncio
 from stt_api.services.storage import job_manager, JobStatus
 from stt_api.services.pipeline import run_batch_pipeline
-from stt_api.core.celery_config import celery_app
+from stt_api.core.celery_config import celery_app, run_in_worker_loop, on_worker_loop_shutdown
 from stt_api.core.logging_config import get_logger
 from stt_api.services.llm import llm_service
 
 logger = get_logger(__name__)
 
+# ✅ 워커 종료 시 LLM 공용 HTTP 클라이언트 정리
+on_worker_loop_shutdown(llm_service.close)
+
 
 @celery_app.task
 def run_stt_and_summary_pipeline(job_id: str, audio_file_path: str):
@@ -15,8 +17,8 @@ def run_stt_and_summary_pipeline(job_id: str, audio_file_path: str):
     """
     try:
         # run_batch_pipeline 내부에서 대부분의 에러를 처리하지만,
-        # asyncio.run 자체가 실패하는 경우를 대비해 외부 try-except 유지
-        result = asyncio.run(run_batch_pipeline(job_id, audio_file_path))
+        # 루프 실행 자체가 실패하는 경우를 대비해 외부 try-except 유지
+        result = run_in_worker_loop(run_batch_pipeline(job_id, audio_file_path))
         return result
     except Exception as e:
         error_msg = f"Asyncio 실행 실패: {str(e)}"
@@ -27,9 +29,9 @@ def run_stt_and_summary_pipeline(job_id: str, audio_file_path: str):
             await job_manager.log_error(job_id, "celery_asyncio", error_msg)
             await job_manager.update_status(job_id, JobStatus.COMPLETED, error_message=error_msg)
 
-        # ✅ 새로운 이벤트 루프를 생성하여 에러 처리 실행
+        # ✅ 워커 루프에서 에러 처리 실행
         try:
-            asyncio.run(_handle_error())
+            run_in_worker_loop(_handle_error())
         except Exception as inner_e:
             logger.error("에러 핸들링 중 추가 오류 발생", error=str(inner_e))
 
@@ -52,17 +54,10 @@ def generate_room_summary_task(self, room_id: str):
             is_ready = await job_manager.is_room_ready_for_summary(room_id)
 
             if not is_ready:
+                # ✅ 재시도는 Celery 스레드(태스크 본문)에서 예약해야 하므로 결과로만 알림
+                # (self.request는 스레드 로컬이라 워커 루프 스레드에서는 빈 컨텍스트)
                 status_summary = await job_manager.get_room_job_status_summary(room_id)
-
-                logger.warning(
-                    "[RoomSummary] 아직 진행 중인 작업 있음, 10초 후 재시도",
-                    room_id=room_id,
-                    status_summary=status_summary,
-                    retry_count=self.request.retries
-                )
-
-                # ✅ 10초 후 재시도 (최대 5회)
-                raise self.retry(countdown=10, exc=Exception("작업 아직 진행 중"))
+                return {"status": "not_ready", "room_id": room_id, "status_summary": status_summary}
 
             # ✅ 안전장치 2: 완료된 모든 대화록 조회
             transcripts = await job_manager.get_completed_room_transcripts(room_id)
@@ -131,12 +126,24 @@ def generate_room_summary_task(self, room_id: str):
 
     # 비동기 함수 실행
     try:
-        result = asyncio.run(_generate_summary())
-        return result
+        result = run_in_worker_loop(_generate_summary())
     except Exception as e:
         logger.error(
             "[RoomSummary] Asyncio 실행 실패",
             room_id=room_id,
             error=str(e)
         )
-        return {"status": "failed", "error": str(e)}
\ No newline at end of file
+        return {"status": "failed", "error": str(e)}
+
+    if result.get("status") == "not_ready":
+        logger.warning(
+            "[RoomSummary] 아직 진행 중인 작업 있음, 10초 후 재시도",
+            room_id=room_id,
+            status_summary=result.get("status_summary"),
+            retry_count=self.request.retries
+        )
+
+        # ✅ 10초 후 재시도 (최대 5회)
+        raise self.retry(countdown=10, exc=Exception("작업 아직 진행 중"))
+
+    return result
\ No newline at end of file
@@ -39,49 +39,60 @@ def on_message(ws, message):
     """서버로부터 메시지 수신"""
     try:
         data = json.loads(message)
-        msg_type = data.get("type", "unknown")
+    except json.JSONDecodeError:
+        print(f"\n⚠️  [JSON 파싱 실패] {message}\n")
+        return
 
-        if msg_type == "connection_success":
-            print(f"\n✅ [연결 성공] {data.get('message')}")
-            print(f"   VAD 설정: {data.get('vad_config')}\n")
-            stats["start_time"] = time.time()
+    # ✅ 한 프레임에 여러 결과가 묶여 오면 하나씩 풀어서 처리
+    if data.get("type") == "batch":
+        for item in data.get("items", []):
+            handle_message(item)
+    else:
+        handle_message(data)
 
-        elif msg_type == "transcript_segment":
-            stats["segments_received"] += 1
 
-            segment_num = data.get("segment_number", "?")
-            text = data.get("text", "")
-            processing_ms = data.get("processing_time_ms", 0)
+def handle_message(data):
+    """개별 메시지 처리"""
+    msg_type = data.get("type", "unknown")
 
-            stats["total_text_length"] += len(text)
+    if msg_type == "connection_success":
+        print(f"\n✅ [연결 성공] {data.get('message')}")
+        print(f"   VAD 설정: {data.get('vad_config')}\n")
+        stats["start_time"] = time.time()
 
-            print(f"\n🗣️  [세그먼트 #{segment_num}]")
-            print(f"   📝 텍스트: {text}")
-            print(f"   ⏱️  처리 시간: {processing_ms:.2f}ms")
-            print()
+    elif msg_type == "transcript_segment":
+        stats["segments_received"] += 1
 
-        elif msg_type == "final_summary":
-            summary = data.get("summary", {})
-            total_segments = data.get("total_segments", 0)
+        segment_num = data.get("segment_number", "?")
+        text = data.get("text", "")
+        processing_ms = data.get("processing_time_ms", 0)
 
-            elapsed = time.time() - stats["start_time"] if stats["start_time"] else 0
+        stats["total_text_length"] += len(text)
 
-            print("\n" + "="*60)
-            print("📊 최종 요약")
-            print("="*60)
-            print(f"총 세그먼트: {total_segments}")
-            print(f"총 처리 시간: {elapsed:.2f}초")
-            print(f"요약 내용: {json.dumps(summary, ensure_ascii=False, indent=2)}")
-            print("="*60 + "\n")
+        print(f"\n🗣️  [세그먼트 #{segment_num}]")
+        print(f"   📝 텍스트: {text}")
+        print(f"   ⏱️  처리 시간: {processing_ms:.2f}ms")
+        print()
 
-        elif msg_type == "error":
-            print(f"\n❌ [서버 오류] {data.get('message')}\n")
+    elif msg_type == "final_summary":
+        summary = data.get("summary", {})
+        total_segments = data.get("total_segments", 0)
 
-        else:
-            print(f"\n🔔 [알 수 없는 메시지] {message}\n")
+        elapsed = time.time() - stats["start_time"] if stats["start_time"] else 0
 
-    except json.JSONDecodeError:
-        print(f"\n⚠️  [JSON 파싱 실패] {message}\n")
+        print("\n" + "="*60)
+        print("📊 최종 요약")
+        print("="*60)
+        print(f"총 세그먼트: {total_segments}")
+        print(f"총 처리 시간: {elapsed:.2f}초")
+        print(f"요약 내용: {json.dumps(summary, ensure_ascii=False, indent=2)}")
+        print("="*60 + "\n")
+
+    elif msg_type == "error":
+        print(f"\n❌ [서버 오류] {data.get('message')}\n")
+
+    else:
+        print(f"\n🔔 [알 수 없는 메시지] {data}\n")
 
 
 def on_error(ws, error):
@@ -92,6 +103,9 @@ def on_close(ws, close_status_code, close_msg):
     print("\n" + "="*60)
     print("🏁 WebSocket 연결 종료")
     print("="*60)
+    if close_status_code and close_status_code != 1000:
+        # 서버 오류는 별도 메시지 없이 close code/reason으로 전달됨
+        print(f"❌ [서버 오류] code={close_status_code} reason={close_msg}")
     print(f"수신한 세그먼트: {stats['segments_received']}개")
     print(f"총 텍스트 길이: {stats['total_text_length']}자")
     print("="*60 + "\n")